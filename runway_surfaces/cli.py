@@ -6,6 +6,16 @@ import click
 import csv
 from typing import TextIO
 
+# the csv stores runway and approach types by enum member name
+_RUNWAY_BY_NAME = {runway_type.name: runway_type for runway_type in RunwayTypes}
+_APPROACH_BY_NAME = {approach_type.name: approach_type for approach_type in ApproachTypes}
+
+# columns every runway csv has to contain, in the order they're unpacked in ``cli``
+_CSV_COLUMNS = ("name", "type", "approaches", "coords", "end_names", "special_surface")
+
+# values of the special_surface column that mean the runway has a special surface
+_TRUTHY = frozenset({"true", "True", "TRUE", "yes", "Yes", "YES", "1", "y", "Y"})
+
 @click.command()
 @click.argument(
     "csvfile",
@@ -31,33 +41,47 @@ from typing import TextIO
     help="The established airport elevation measured above sea level"
 )
 @click.option(
-    "u", "units",
-    type=click.Choice(["feet", "meters"]),
-    case_sensitive=False,
+    "-u", "--units",
+    type=click.Choice(["feet", "meters"], case_sensitive=False),
     default="feet",
     help="Units of the elevation and output"
 )
-def cli(csvfile: TextIO, position: tuple[np.float64, np.float64], elevation: np.float64, eae: np.float64, units):
+def cli(csvfile: TextIO, position: tuple[np.float64, np.float64], elevation: np.float64, eae: np.float64, units: str):
     """Get imaginary zone info given a .csv file of runways, CSVFILE, a position, POSITION, and an established airport elevation, EAE
     """
 
     if not csvfile.name.lower().endswith(".csv"):
         click.echo(f"{csvfile.name} is not a .csv file!")
 
-    runways = []
-    csvr = csv.DictReader(csvfile)
-    for row in csvr:
-        name = row["name"]
-        type = row["type"].upper()
-        approaches = row["approaches"].upper().split('-')
-        coords = row["coords"].split('_')
-        coords = [degrees_to_feet((np.float64(coords[0]), np.float64(coords[1])), position), degrees_to_feet((np.float64(coords[2]), np.float64(coords[3])), position)]
-        end_names = row["end_names"].split('-')
-        special_surface = True if row["special_surface"].lower() == "true" else False
+    runways: list[Runway] = []
+    reader = csv.reader(csvfile)
+    header = next(reader)
+    name_col, type_col, approaches_col, coords_col, end_names_col, special_surface_col = (header.index(column) for column in _CSV_COLUMNS)
+    # skip blank lines like csv.DictReader does
+    rows: list[list[str]] = [row for row in reader if row]
+
+    # every row's coordinates are checked on their own so that a malformed row can't shift the values of the rows after it
+    values: list[list[str]] = []
+    for row in rows:
+        row_values = row[coords_col].split('_')
+        if len(row_values) != 4:
+            raise click.BadParameter(f"runway {row[name_col]} has {len(row_values)} coordinate values instead of 4: {row[coords_col]}", param_hint="CSVFILE")
+        values.append(row_values)
+
+    # convert every runway endpoint to feet at once instead of row by row, as an (n, 2, 2) array of each runway's ends
+    coords: np.ndarray = np.array(values, dtype=np.float64).reshape(-1, 2)
+    coords = degrees_to_feet_batch(coords, position).reshape(-1, 2, 2)
 
-        end1 = RunwayEnd(end_names[0], coords[0], ApproachTypes[approaches[0]])
-        end2 = RunwayEnd(end_names[1], coords[1], ApproachTypes[approaches[1]])
-        runways.append(Runway(name, RunwayTypes[type], end1, end2, special_surface=special_surface))
+    for i, row in enumerate(rows):
+        name = row[name_col]
+        type = row[type_col].upper()
+        approaches = row[approaches_col].upper().split('-')
+        end_names = row[end_names_col].split('-')
+        special_surface = row[special_surface_col] in _TRUTHY
+
+        end1 = RunwayEnd(end_names[0], tuple(coords[i, 0]), _APPROACH_BY_NAME[approaches[0]])
+        end2 = RunwayEnd(end_names[1], tuple(coords[i, 1]), _APPROACH_BY_NAME[approaches[1]])
+        runways.append(Runway(name, _RUNWAY_BY_NAME[type], end1, end2, special_surface=special_surface))
 
     pos = (0, 0, elevation / 0.3048) if units == "meters" else (0, 0, elevation)
     info = get_zone_information(pos, runways, eae)
@@ -65,13 +89,16 @@ def cli(csvfile: TextIO, position: tuple[np.float64, np.float64], elevation: np.
     zone = info["zone"]
     if zone == "N/A":
         click.echo(f"{position} was not found in any imaginary zone")
-    else:
-        if units == "meters":
-            info["build_limit"] = info["build_limit"] * 0.3048
-        if "runway" in info:
-            if "end" in info:
-                click.echo(f"({str(position[0])},{str(position[1])}) was found in the {zone} Surface for runway {info["runway"]} at end {info["end"]}. The maximum build limit is {info["build_limit"]} {units}")
-            else:
-                click.echo(f"({str(position[0])},{str(position[1])}) was found in the {zone} Surface for runway {info["runway"]}. The maximum build limit is {info["build_limit"]} {units}")
-        else:
-            click.echo(f"({str(position[0])},{str(position[1])}) was found in the {zone} Surface. The maximum build limit is {info["build_limit"]} {units}")
\ No newline at end of file
+        return
+
+    if units == "meters":
+        info["build_limit"] = info["build_limit"] * 0.3048
+
+    # build the message once and write it with a single echo
+    surface = f"the {zone} Surface"
+    if "runway" in info:
+        surface += f" for runway {info['runway']}"
+        if "end" in info:
+            surface += f" at end {info['end']}"
+
+    click.echo(f"({str(position[0])},{str(position[1])}) was found in {surface}. The maximum build limit is {info['build_limit']} {units}")
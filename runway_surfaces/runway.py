@@ -1,4 +1,8 @@
+from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Mapping, Optional
 import numpy as np
 
 class RunwayTypes(Enum):
@@ -20,10 +24,90 @@ class ApproachTypes(Enum):
 	PRECISION_INSTRUMENT = 2
 
 
+# primary surface widths keyed by runway type and whether both ends only have visual approaches
+# non-precision instrument runways also depend on visibility minimums, so they aren't in this table
+_PSURFACE_WIDTHS = {
+	(RunwayTypes.UTILITY, True): 250,
+	(RunwayTypes.UTILITY, False): 500,
+	(RunwayTypes.VISUAL, True): 500,
+	(RunwayTypes.PRECISION_INSTRUMENT, True): 1000,
+	(RunwayTypes.PRECISION_INSTRUMENT, False): 1000,
+}
+
+_HSURFACE_RADII = {
+	RunwayTypes.UTILITY: 5000,
+	RunwayTypes.VISUAL: 5000,
+	RunwayTypes.NON_PRECISION_INSTRUMENT: 10000,
+	RunwayTypes.PRECISION_INSTRUMENT: 10000,
+}
+
+
+@dataclass(frozen=True, slots=True)
+class ApproachDimensions:
+	"""The dimensions of the approach surface at one end of a runway
+
+	Precision instrument approaches have a primary and a secondary section, so they use ``primary_length``, ``secondary_length``,
+	``primary_slope``, and ``secondary_slope`` instead of ``length`` and ``slope``. Dimensions that don't apply are ``None``.
+
+	Instances are shared between every runway with the same dimensions, so they're frozen.
+
+	:param ApproachTypes type: the type of approach
+	:param np.float64 width: the width of the far end of the approach surface, defaults to None
+	:param np.float64 length: the length of the approach surface, defaults to None
+	:param np.float64 slope: the slope of the approach surface, defaults to None
+	:param np.float64 primary_length: the length of the first section of a precision instrument approach surface, defaults to None
+	:param np.float64 secondary_length: the length of the second section of a precision instrument approach surface, defaults to None
+	:param np.float64 primary_slope: the slope of the first section of a precision instrument approach surface, defaults to None
+	:param np.float64 secondary_slope: the slope of the second section of a precision instrument approach surface, defaults to None
+	"""
+
+	type: ApproachTypes
+	width: Optional[np.float64] = None
+	length: Optional[np.float64] = None
+	slope: Optional[np.float64] = None
+	primary_length: Optional[np.float64] = None
+	secondary_length: Optional[np.float64] = None
+	primary_slope: Optional[np.float64] = None
+	secondary_slope: Optional[np.float64] = None
+
+
+@lru_cache(maxsize=None)
+def _approach_dimensions(runway_type: RunwayTypes, approach_type: ApproachTypes, visibility: int) -> ApproachDimensions:
+	"""Calculates the dimensions of the approach surface at one end of a runway
+
+	The dimensions only depend on the arguments, so they are cached and shared. ``ApproachDimensions`` is immutable, so this is safe.
+
+	:param RunwayTypes runway_type: the type of runway
+	:param ApproachTypes approach_type: the type of approach at the end of the runway
+	:param int visibility: ``-1``, ``0``, or ``1`` if the runway's visibility minimums are less than, equal to, or greater than 3/4 of a mile
+	:return ApproachDimensions: the dimensions of the approach surface
+	"""
+
+	if approach_type == ApproachTypes.VISUAL:
+		width = 1250 if runway_type == RunwayTypes.UTILITY else 1500
+		return ApproachDimensions(approach_type, width=width, length=5000, slope=0.05)
+	elif approach_type == ApproachTypes.NON_PRECISION_INSTRUMENT:
+		if runway_type == RunwayTypes.UTILITY:
+			return ApproachDimensions(approach_type, width=2000, length=5000, slope=0.05)
+
+		width = None
+		if visibility > 0:
+			width = 3500
+		elif visibility == 0:
+			width = 4000
+		return ApproachDimensions(approach_type, width=width, length=10000, slope=1.0 / 34.0)
+	elif approach_type == ApproachTypes.PRECISION_INSTRUMENT:
+		return ApproachDimensions(approach_type, width=16000, primary_length=10000, secondary_length=40000, primary_slope=0.02, secondary_slope=0.025)
+
+	return ApproachDimensions(approach_type)
+
+
 class RunwayEnd:
 	"""Represents the end of a runway
 	"""
 
+	__slots__ = ("name", "point", "_approach_type")
+
 	def __init__(self, name: str, point: tuple[np.float64, np.float64], approach_type: ApproachTypes):
 		r"""Creates a new ``RunwayEnd`` object
 
@@ -34,13 +118,28 @@ class RunwayEnd:
 
 		self.name = name
 		self.point = point
-		self.approach_type = approach_type
+		self._approach_type = approach_type
+
+
+	@property
+	def approach_type(self) -> ApproachTypes:
+		"""The type of approach found at this end of the runway
+
+		It's read-only since the runway this end belongs to caches the dimensions of its approach surface.
+		"""
+
+		return self._approach_type
 
 
 class Runway:
 	"""Represents an airport's runway
+
+	The dimensions of the runway's surfaces are calculated once when it's created,
+	so the runway type, ends, and visibility minimums they depend on are read-only.
 	"""
 
+	__slots__ = ("name", "_runway_type", "_end1", "_end2", "special_surface", "_visiblity_minimums", "_visual_only", "_has_npia", "_psurface_width", "_hsurface_radius", "_approach_dimensions")
+
 	def __init__(self, name: str, runway_type: RunwayTypes, end1: RunwayEnd, end2: RunwayEnd, special_surface: bool = False, visibility_minimums: int = 0):
 		"""Creates a new ``Runway`` object
 
@@ -53,11 +152,50 @@ class Runway:
 		"""
 
 		self.name = name
-		self.runway_type = runway_type
-		self.end1 = end1
-		self.end2 = end2
+		self._runway_type = runway_type
+		self._end1 = end1
+		self._end2 = end2
 		self.special_surface = special_surface
-		self.visiblity_minimums = visibility_minimums
+		self._visiblity_minimums = visibility_minimums
+		self._visual_only = end1.approach_type == ApproachTypes.VISUAL and end2.approach_type == ApproachTypes.VISUAL
+		self._has_npia = end1.approach_type == ApproachTypes.NON_PRECISION_INSTRUMENT or end2.approach_type == ApproachTypes.NON_PRECISION_INSTRUMENT
+
+		# these only depend on the information above, so they're calculated once
+		self._psurface_width = self._compute_psurface_width()
+		self._hsurface_radius = _HSURFACE_RADII[runway_type]
+		self._approach_dimensions = MappingProxyType(self._compute_approach_dimensions())
+
+
+	@property
+	def runway_type(self) -> RunwayTypes:
+		"""The type of runway
+		"""
+
+		return self._runway_type
+
+
+	@property
+	def end1(self) -> RunwayEnd:
+		"""One endpoint of the runway
+		"""
+
+		return self._end1
+
+
+	@property
+	def end2(self) -> RunwayEnd:
+		"""The opposite endpoint of the runway
+		"""
+
+		return self._end2
+
+
+	@property
+	def visiblity_minimums(self) -> int:
+		"""The visibility minimums of the runway
+		"""
+
+		return self._visiblity_minimums
 	
 	
 	def calc_psurface_width(self) -> int:
@@ -66,27 +204,25 @@ class Runway:
 		:return int: the width of the primary surface
 		"""
 
-		visual_only = self.end1.approach_type == ApproachTypes.VISUAL and self.end2.approach_type == ApproachTypes.VISUAL
-		has_npia = self.end1.approach_type == ApproachTypes.NON_PRECISION_INSTRUMENT or self.end2.approach_type == ApproachTypes.NON_PRECISION_INSTRUMENT
+		return self._psurface_width
+	
 
-		if self.runway_type == RunwayTypes.UTILITY:
-			if visual_only:
-				return 250
-			return 500
-		elif self.runway_type == RunwayTypes.VISUAL:
-			if visual_only:
-				return 500
-		elif self.runway_type == RunwayTypes.NON_PRECISION_INSTRUMENT:
-			if has_npia:
+	def _compute_psurface_width(self) -> int:
+		"""Computes the width of the primary surface for ``calc_psurface_width``
+
+		:return int: the width of the primary surface
+		"""
+
+		if self.runway_type == RunwayTypes.NON_PRECISION_INSTRUMENT:
+			if self._has_npia:
 				if self.visiblity_minimums >= 0.75:
 					return 1000
 			elif self.visiblity_minimums > 0.75:
 				return 500
-		elif self.runway_type == RunwayTypes.PRECISION_INSTRUMENT:
-			return 1000
-		
-		# primary surface width was not specificied at this point
-		return 0
+			return 0
+
+		# primary surface width was not specified if it isn't in the table
+		return _PSURFACE_WIDTHS.get((self.runway_type, self._visual_only), 0)
 	
 
 	def calc_hsurface_radius(self) -> int:
@@ -94,76 +230,31 @@ class Runway:
 
 		:return int: the radius of the runway to the horizontal surface
 		"""
-		if self.runway_type == RunwayTypes.UTILITY or self.runway_type == RunwayTypes.VISUAL:
-			return 5000
-		
-		return 10000
+
+		return self._hsurface_radius
 	
 
-	# regulations on approach surfaces dimensions are all over the fucking place
-	def calc_approach_dimensions(self) -> dict[RunwayEnd, dict[str, np.float64]]:
+	def calc_approach_dimensions(self) -> Mapping[RunwayEnd, ApproachDimensions]:
 		"""Calculates the dimensions of the approaches at either end of the runway
 
-		:return dict[RunwayEnd, dict[str, np.float64]]: a mapping of the runway's end to its dimensions
+		The mapping is shared between calls, so it's a read-only view.
+
+		:return Mapping[RunwayEnd, ApproachDimensions]: a mapping of the runway's end to its dimensions
 		"""
 
-		dim = {self.end1: {}, self.end2: {}}
-		end1_type = self.end1.approach_type
-		end2_type = self.end2.approach_type
-
-		dim[self.end1]["type"] = end1_type
-		dim[self.end2]["type"] = end2_type
-		
-		if end1_type == ApproachTypes.VISUAL:
-			if self.runway_type == RunwayTypes.UTILITY:
-				dim[self.end1]["width"] = 1250
-			else:
-				dim[self.end1]["width"] = 1500
-			dim[self.end1]["length"] = 5000
-			dim[self.end1]["slope"] = 0.05
-		elif end1_type == ApproachTypes.NON_PRECISION_INSTRUMENT:
-			if self.runway_type == RunwayTypes.UTILITY:
-				dim[self.end1]["width"] = 2000
-				dim[self.end1]["length"] = 5000
-				dim[self.end1]["slope"] = 0.05
-			else:
-				dim[self.end1]["length"] = 10000
-				dim[self.end1]["slope"] = 1.0 / 34.0
-				if self.visiblity_minimums > 0.75:
-					dim[self.end1]["width"] = 3500
-				elif self.visiblity_minimums == 0.75:
-					dim[self.end1]["width"] = 4000
-		elif end1_type == ApproachTypes.PRECISION_INSTRUMENT:
-			dim[self.end1]["width"] = dim[self.end2]["width"] = 16000
-			dim[self.end1]["primary_length"] = 10000
-			dim[self.end1]["secondary_length"] = 40000
-			dim[self.end1]["primary_slope"] = 0.02
-			dim[self.end1]["secondary_slope"] = 0.025
-			
-		if end2_type == ApproachTypes.VISUAL:
-			if self.runway_type == RunwayTypes.UTILITY:
-				dim[self.end2]["width"] = 1250
-			else:
-				dim[self.end2]["width"] = 1500
-			dim[self.end2]["length"] = 5000
-			dim[self.end2]["slope"] = 0.05
-		elif end2_type == ApproachTypes.NON_PRECISION_INSTRUMENT:
-			if self.runway_type == RunwayTypes.UTILITY:
-				dim[self.end2]["width"] = 2000
-				dim[self.end2]["length"] = 5000
-				dim[self.end2]["slope"] = 0.05
-			else:
-				dim[self.end2]["length"] = 10000
-				dim[self.end2]["slope"] = 1.0 / 34.0
-				if self.visiblity_minimums > 0.75:
-					dim[self.end2]["width"] = 3500
-				elif self.visiblity_minimums == 0.75:
-					dim[self.end2]["width"] = 4000
-		elif end2_type == ApproachTypes.PRECISION_INSTRUMENT:
-			dim[self.end2]["width"] = dim[self.end2]["width"] = 16000
-			dim[self.end2]["primary_length"] = 10000
-			dim[self.end2]["secondary_length"] = 40000
-			dim[self.end2]["primary_slope"] = 0.02
-			dim[self.end2]["secondary_slope"] = 0.025
-		
-		return dim
\ No newline at end of file
+		return self._approach_dimensions
+	
+
+	# regulations on approach surfaces dimensions are all over the fucking place
+	def _compute_approach_dimensions(self) -> dict[RunwayEnd, ApproachDimensions]:
+		"""Computes the dimensions of the approaches for ``calc_approach_dimensions``
+
+		:return dict[RunwayEnd, ApproachDimensions]: a mapping of the runway's end to its dimensions
+		"""
+
+		visibility = int(self.visiblity_minimums > 0.75) - int(self.visiblity_minimums < 0.75)
+
+		return {
+			self.end1: _approach_dimensions(self.runway_type, self.end1.approach_type, visibility),
+			self.end2: _approach_dimensions(self.runway_type, self.end2.approach_type, visibility),
+		}
@@ -1,11 +1,13 @@
 from .runway import *
 from .util import *
-from typing import Optional
+from typing import Mapping, Optional
 
 class Edge():
 	"""Represents a straight or curved edge of a horizontal surface around a series of runways
 	"""
 
+	__slots__ = ("p1", "p2", "center")
+
 	def __init__(self, p1: tuple[np.float64, np.float64], p2: tuple[np.float64, np.float64], center: tuple[np.float64, np.float64] = tuple()):
 		r"""Creates a new ``Edge`` object
 
@@ -24,13 +26,13 @@ class Edge():
 
 class Arc(Edge):
 
+	__slots__ = ("radius",)
+
 	def __init__(self, center: tuple[np.float64, np.float64], radius: np.float64):
 		self.center = center
 		self.radius = radius
 
 
-
-# TODO: optimize this. since it's already in ccw order, no need to check every possible common tangent at first
 def get_horizontal_surface_edges(runways: list[Runway]) -> list[Edge]:
 	r"""Gets the outline of the horizontal surface encompassing every runway in ``runways``
 	
@@ -41,107 +43,103 @@ def get_horizontal_surface_edges(runways: list[Runway]) -> list[Edge]:
 	"""
 
 	edges = []
-	psurface_vertices = {}
+	endpoint_radii = {}
 
 	if len(runways) == 0:
 		return edges
 	
-	# get the correct primary surface endpoints for each runway
-	for runway in runways:
-		extended_endpoints = (runway.end1.point, runway.end2.point)
-
-		if (runway.special_surface):
-			extended_endpoints = extend_points_in_both_directions(runway.end1.point, runway.end2.point, np.float64(200))
-
-		r = runway.calc_hsurface_radius()
-		psurface_vertices[tuple(extended_endpoints[0])] = r
-		psurface_vertices[tuple(extended_endpoints[1])] = r
-
-	# sort points in counter-clockwise order
-	endpoints = list(psurface_vertices.keys())
-	sort_directional(endpoints, ccw=True)
-	psurface_vertices = {point: psurface_vertices[point] for point in endpoints}
-
-	current_circle = 0
-	for i in range(len(endpoints)):
-		current_circle = i
-		prev_edge = edges[-1] if len(edges) > 0 else None
-		c1 = endpoints[current_circle]
-		p1 = None
-		p2 = None
-
-		secondary_circle = i
-		c2 = tuple()
-		for j in range(len(endpoints)):
-			c2 = endpoints[secondary_circle]
-
-			# avoid trying to connect a circle to itself
-			# avoid trying to connect circles inside of circles // (next_point >= 0 and next_point == j)
-			if secondary_circle == current_circle or circle_in_circle(c1, psurface_vertices[c1], c2, psurface_vertices[c2]):
-				secondary_circle = (secondary_circle + 1) % len(endpoints)
-				continue
-
-			tangent_line = cet2cr(c1, psurface_vertices[c1], c2, psurface_vertices[c2])
-			
-			if len(tangent_line) == 0:
-				secondary_circle = (secondary_circle + 1) % len(endpoints)
-				continue
-
-			p1 = tangent_line[0]
-			p2 = tangent_line[1]
-
-			for u in range(len(endpoints)):
-				t1 = endpoints[u]
-				t2 = endpoints[(u + 1) % len(endpoints)]
-
-				# if the tangent line intersects any perimeter segment,
-				# then it isn't valid
-				if len(lis_4p(p1, p2, t1, t2)) > 0:
-					p1 = None
-					p2 = None
-					break
-				
-				# if the tangent line intersects any other circle than those that it's tangent to,
-				# then it isn't valid
-				if u != current_circle and u != secondary_circle:
-					a = np.float64(0)
-					b = np.float64(0)
-					c = np.float64(0)
-					if p2[0] - p1[0] == 0:
-						a = 1
-						c = -p1[0]
-					else:
-						m = (p2[1] - p1[1]) / (p2[0] - p1[0])
-						a = -m
-						b = 1
-						c = m * p1[0] - p1[1]
-					
-					# if the line is a common external tangent to 3 circles then it still counts
-					#
-					# no need to check the side of the 3rd circle's tangent point since,
-					# if it's on the wrong side, it will intersect a line segment as well
-					l = len(line_intersects_circle(np.float64(a), np.float64(b), c, t1, psurface_vertices[t1]))
-					if l == 0 or l == 1:
-						continue
-					else:
-						p1 = None
-						p2 = None
-						break
-			
-			# if the tangent line does not intersect any perimeter segments nor any other circles,
-			# it is valid
-			if p1 and p2:
-				current_circle = secondary_circle
+	# get the correct primary surface endpoints for each runway as an (N, 2, 2) array
+	ends = np.array([(runway.end1.point, runway.end2.point) for runway in runways], dtype=np.float64)
+	special = np.fromiter((runway.special_surface for runway in runways), dtype=bool, count=len(runways))
+
+	# runways with a special surface are extended by 200 feet at both ends, all at once
+	if np.any(special):
+		ends[special, 0], ends[special, 1] = extend_points_in_both_directions_batch(ends[special, 0], ends[special, 1], np.float64(200))
+
+	points = ends.reshape(-1, 2)
+	radii = np.repeat(np.fromiter((runway.calc_hsurface_radius() for runway in runways), dtype=np.float64, count=len(runways)), 2)
+
+	# runways can share endpoints, so duplicates are removed by keying on the point rounded to a thousandth of a foot,
+	# which also merges endpoints that only differ by floating point error.
+	# a shared endpoint keeps the larger radius so that the surface still covers every runway
+	rounded_endpoints = {}
+	for point, r in zip(points, radii):
+		point = tuple(point)
+		key = (round(point[0], 3), round(point[1], 3))
+		if key in rounded_endpoints:
+			point = rounded_endpoints[key]
+			r = max(r, endpoint_radii[point])
+		else:
+			rounded_endpoints[key] = point
+		endpoint_radii[point] = r
+
+	# sort points in counter-clockwise order, keeping the points and their radii as parallel (n, 2) and (n,) arrays
+	points = np.array(list(endpoint_radii), dtype=np.float64).reshape(-1, 2)
+	order = argsort_directional(points, ccw=True)
+	points = points[order]
+	radii = np.fromiter(endpoint_radii.values(), dtype=np.float64, count=len(points))[order]
+	# the outline's points are stored as tuples like everywhere else
+	endpoints = [tuple(point) for point in points]
+
+	# a single runway is just two equal circles, so its outline is the straight tangent on either side
+	# joined by the arcs around either end and doesn't need the tangent search
+	if len(endpoints) == 2 and radii[0] == radii[1]:
+		(ax, ay), (bx, by) = endpoints
+		r = radii[0]
+		l = math.hypot(bx - ax, by - ay)
+		ox = r * (by - ay) / l
+		oy = r * (bx - ax) / l
+		return [
+			Edge((ax + ox, ay - oy), (bx + ox, by - oy)),
+			Arc(endpoints[1], r),
+			Edge((bx - ox, by + oy), (ax - ox, ay + oy)),
+			Edge((ax - ox, ay + oy), (ax + ox, ay - oy), center=endpoints[0]),
+		]
+
+	# from here on, circles are addressed by their index in ``points``
+	# which circles are inside of each other doesn't change, so it's only checked once for every pair
+	contained = circle_in_circle_batch(points, radii)
+
+	n = len(endpoints)
+
+	# get the tangent line from every circle to every other circle at once as an (n, n, 2, 2) array.
+	# most of these are never used, but computing all of them in one vectorized call is cheaper
+	# than searching for the next valid tangent pair by pair
+	first = np.repeat(np.arange(n), n)
+	second = np.tile(np.arange(n), n)
+	tangents = cet2cr_batch(points[first], radii[first], points[second], radii[second]).reshape(n, n, 2, 2)
+
+	# every circle has to be on or to the left of a tangent line for it to be part of the outline.
+	# if any circle is on the other side or crosses it, then the tangent line would cross a perimeter segment
+	# or cut through that circle, so it isn't valid
+	#
+	# if the line is a common external tangent to 3 circles then it still counts,
+	# so a little slack is given for rounding errors
+	# this is an (n, n, n) array, so memory grows with the cube of the number of endpoints.
+	# airports have few enough runways for that to stay small
+	distances = get_signed_distances(tangents[:, :, 0], tangents[:, :, 1], points)
+	# the two circles a tangent line touches are always fine
+	distances[np.arange(n)[:, np.newaxis], np.arange(n), np.arange(n)[:, np.newaxis]] = np.inf
+	distances[np.arange(n)[:, np.newaxis], np.arange(n), np.arange(n)] = np.inf
+	# avoid trying to connect circles inside of circles, which also covers a circle with itself
+	valid = ~contained & ~np.any(distances < radii - 1e-6, axis=2)
+
+	for i in range(n):
+		c1 = endpoints[i]
+		tangent_line = None
+
+		# try the other circles in counter-clockwise order, starting with the next one
+		for secondary_circle in (*range(i + 1, n), *range(i)):
+			if valid[i, secondary_circle]:
+				tangent_line = (tuple(tangents[i, secondary_circle, 0]), tuple(tangents[i, secondary_circle, 1]))
 				break
 
-			secondary_circle = (secondary_circle + 1) % len(endpoints)
-
 		# if no tangent line that doesn't have an invalid intersection is found,
 		# then this point would either create a concavity or a self intersection in the final surface
-		if p1 and p2:
-			if prev_edge:
-				edges.append(Arc(c1, calc_distance(c1, p1)))
-			edges.append(Edge(p1, p2))
+		if tangent_line is not None:
+			if edges:
+				edges.append(Arc(c1, radii[i]))
+			edges.append(Edge(tangent_line[0], tangent_line[1]))
 	# since runways aren't allowed to have differing radii at their endpoints, len(edges) will always be at least 3 at this point
 	edges.append(Edge(edges[-1].p2, edges[0].p1, center=endpoints[0]))
 	return edges
@@ -162,40 +160,41 @@ def get_primary_surface_vertices(runway: Runway) -> dict[RunwayEnd, list[tuple[n
 		endpoints = extend_points_in_both_directions(runway.end1.point, runway.end2.point, np.float64(200))
 	
 	# get vertices along lines perpendicular to the line defined by the endpoints
+	# both sides share the same offset from the centerline, so it's calculated once (see ``create_right_triangle``)
 	w = runway.calc_psurface_width() / np.float64(2.0)
-	side2 = create_right_triangle(endpoints[0], endpoints[1], w)
-	side1 = create_right_triangle(endpoints[1], endpoints[0], w)
+	dx = endpoints[1][0] - endpoints[0][0]
+	dy = endpoints[1][1] - endpoints[0][1]
+	l = calc_distance(endpoints[0], endpoints[1])
 
-	if len(side1) == 0 or len(side2) == 0:
+	if l == 0:
 		return dict()
+
+	ox = (w * dy) / l
+	oy = (w * dx) / l
 	
-	vertices[runway.end1] = side1
-	vertices[runway.end2] = side2
+	vertices[runway.end1] = [(endpoints[0][0] + ox, endpoints[0][1] - oy), (endpoints[0][0] - ox, endpoints[0][1] + oy)]
+	vertices[runway.end2] = [(endpoints[1][0] - ox, endpoints[1][1] + oy), (endpoints[1][0] + ox, endpoints[1][1] - oy)]
 
 	return vertices
 
 
-def get_approach_surface_vertices(end_infos: dict[RunwayEnd, dict[str, np.float64]], psurface_vertices: dict[RunwayEnd, list[tuple[np.float64, np.float64]]]) -> dict[RunwayEnd, list[tuple[np.float64, np.float64]]]:
+def get_approach_surface_vertices(end_infos: Mapping[RunwayEnd, ApproachDimensions], psurface_vertices: dict[RunwayEnd, list[tuple[np.float64, np.float64]]]) -> dict[RunwayEnd, list[tuple[np.float64, np.float64]]]:
 	r"""Gets the vertices of the 2D projection of the approach surface
 
 	For each ``RunwayEnd`` in ``end_infos``,
 	a list of 4 2D coordinate points is generated that create bounds for the approach surface.
 
-	:param dict[RunwayEnd, dict[str, np.float64]] end_infos: a mapping of one runway's ends to their respective dimensions/infos as returned by ``Runway.calc_approach_dimensions``
+	:param Mapping[RunwayEnd, ApproachDimensions] end_infos: a mapping of one runway's ends to their respective dimensions/infos as returned by ``Runway.calc_approach_dimensions``
 	:param dict[RunwayEnd, list[tuple[np.float64, np.float64]]] psurface_vertices: a mapping of one runway's ends to the vertices of the primary surface of that runway's end
 	:return dict[RunwayEnd, list[tuple[np.float64, np.float64]]]: a mapping of each runway end of one runway to a list of 2D vertices that are the bounds of the respective approach surface
 	"""
 	
 	vertices: dict[RunwayEnd, list[tuple[np.float64, np.float64]]] = {}
 	
-	entries = list(end_infos.items())
-	end1_dimensions = entries[0][1]
-	end2_dimensions = entries[1][1]
-	end1_vertices = psurface_vertices[entries[0][0]]
-	end2_vertices = psurface_vertices[entries[1][0]]
-
-	vertices[entries[0][0]] = []
-	vertices[entries[1][0]] = []
+	# a runway has exactly two ends
+	(end1, end1_dimensions), (end2, end2_dimensions) = end_infos.items()
+	end1_vertices = psurface_vertices[end1]
+	end2_vertices = psurface_vertices[end2]
 
 	assert end1_vertices
 	assert end2_vertices
@@ -204,44 +203,28 @@ def get_approach_surface_vertices(end_infos: dict[RunwayEnd, dict[str, np.float6
 	end1_midpoint = ((end1_vertices[0][0] + end1_vertices[1][0]) / 2, (end1_vertices[0][1] + end1_vertices[1][1]) / 2)
 	end2_midpoint = ((end2_vertices[0][0] + end2_vertices[1][0]) / 2, (end2_vertices[0][1] + end2_vertices[1][1]) / 2)
 
-	type = end1_dimensions["type"]
-	width = end1_dimensions["width"]
-	length = 0
-
-	if (type == ApproachTypes.PRECISION_INSTRUMENT):
-		length = end1_dimensions["primary_length"] + end1_dimensions["secondary_length"]
-	else:
-		length = end1_dimensions["length"]
-
-	# extend the center line to the length of the approach surface
-	cl = extend_point_in_one_direction(end2_midpoint, end1_midpoint, length)
-	w =  width / 2
+	# both approach surfaces extend along the runway's center line in opposite directions,
+	# so the direction of the center line only needs to be calculated once
+	l = calc_distance(end1_midpoint, end2_midpoint)
+	ux = (end1_midpoint[0] - end2_midpoint[0]) / l
+	uy = (end1_midpoint[1] - end2_midpoint[1]) / l
 
-	# create a right triangle so that the hypotenuse is the desired line
-	triangle = create_right_triangle(end1_midpoint, cl, np.float64(w))
-	
-	# ccw direction
-	vertices[entries[0][0]].append(end1_vertices[0])
-	vertices[entries[0][0]].append(end1_vertices[1])
-	vertices[entries[0][0]].append(triangle[1])
-	vertices[entries[0][0]].append(triangle[0])
-
-	type = end2_dimensions["type"]
-	width = end2_dimensions["width"]
-	length = 0
-
-	if (type == ApproachTypes.PRECISION_INSTRUMENT):
-		length = end1_dimensions["primary_length"] + end1_dimensions["secondary_length"]
-	else:
-		length = end1_dimensions["length"]
+	for end, dimensions, end_vertices, midpoint, direction in ((end1, end1_dimensions, end1_vertices, end1_midpoint, 1), (end2, end2_dimensions, end2_vertices, end2_midpoint, -1)):
+		if dimensions.type == ApproachTypes.PRECISION_INSTRUMENT:
+			length = dimensions.primary_length + dimensions.secondary_length
+		else:
+			length = dimensions.length
+		w = dimensions.width / 2
 
-	cl = extend_point_in_one_direction(end1_midpoint, end2_midpoint, length)
-	triangle = create_right_triangle(end2_midpoint, cl, np.float64(w))
+		# extend the center line to the length of the approach surface,
+		# then offset perpendicular to it by half the width on either side
+		cx = midpoint[0] + direction * length * ux
+		cy = midpoint[1] + direction * length * uy
+		ox = direction * w * uy
+		oy = direction * w * ux
 
-	vertices[entries[1][0]].append(end2_vertices[0])
-	vertices[entries[1][0]].append(end2_vertices[1])
-	vertices[entries[1][0]].append(triangle[1])
-	vertices[entries[1][0]].append(triangle[0])
+		# ccw direction
+		vertices[end] = [end_vertices[0], end_vertices[1], (cx + ox, cy - oy), (cx - ox, cy + oy)]
 
 	return vertices
 
@@ -259,18 +242,16 @@ def get_transitional_surface_vertices(psurface_vertices: dict[RunwayEnd, list[tu
 
 	s1 = []
 	s2 = []
-	entries = list(psurface_vertices.items())
-	end1 = entries[0][0]
-	end2 = entries[1][0]
+	end1, end2 = psurface_vertices
 	end1_vertices = psurface_vertices[end1]
 	end2_vertices = psurface_vertices[end2]
 
 	# calculate distance from runway centerline to straight edge of transitional surface
 	d = calc_dist_for_height(np.float64(1.0) / 7.0, (np.float64(150)))
-	extended1 = extend_points_in_both_directions(end1_vertices[0], end1_vertices[1], d)
-	extended2 = extend_points_in_both_directions(end2_vertices[0], end2_vertices[1], d)
-	v1, v2 = extended1[0], extended1[1]
-	v3, v4 = extended2[0], extended2[1]
+	# a primary surface with no width can't be extended, so its transitional surfaces are nan polygons that contain no point
+	no_extension = [(np.nan, np.nan), (np.nan, np.nan)]
+	v1, v2 = extend_points_in_both_directions(end1_vertices[0], end1_vertices[1], d) or no_extension
+	v3, v4 = extend_points_in_both_directions(end2_vertices[0], end2_vertices[1], d) or no_extension
 
 	# ccw direction
 	s1.append(end1_vertices[0])
@@ -291,26 +272,67 @@ def get_transitional_surface_vertices(psurface_vertices: dict[RunwayEnd, list[tu
 	return [s1, s2]
 
 
-def is_in_horizontal_surface(position: tuple[np.float64, np.float64], hsurface: list[Edge]) -> bool:
+def get_edge_arrays(hsurface: list[Edge]) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+	r"""Splits the edges of a horizontal surface into arrays of straight edges and arcs
+
+	The straight edges are returned as two (S, 2) arrays of their start and end points,
+	and the arcs are returned as an (A, 2) array of their centers and an (A,) array of their radii.
+
+	:param list[Edge] hsurface: a list of ``Edges`` defining a horizontal surface
+	:return tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]: the start points and end points of the straight edges, and the centers and radii of the arcs
+	"""
+
+	lines = [edge for edge in hsurface if type(edge) is not Arc]
+	arcs = [edge for edge in hsurface if type(edge) is Arc]
+
+	p1 = np.array([edge.p1 for edge in lines], dtype=np.float64).reshape(-1, 2)
+	p2 = np.array([edge.p2 for edge in lines], dtype=np.float64).reshape(-1, 2)
+	centers = np.array([edge.center for edge in arcs], dtype=np.float64).reshape(-1, 2)
+	radii = np.array([edge.radius for edge in arcs], dtype=np.float64)
+
+	return p1, p2, centers, radii
+
+
+def is_in_horizontal_surface(position: tuple[np.float64, np.float64], hsurface: list[Edge], edge_arrays: Optional[tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]] = None) -> bool:
 	r"""Checks if ``position`` is in or on the boundary of a horizontal surface defined by ``hsurface``
 
 	:param tuple[np.float64, np.float64] position: a 2D coordinate point
 	:param list[Edge] hsurface: a list of ``Edges`` defining a horizontal surface
+	:param Optional[tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]] edge_arrays: the edges of ``hsurface`` as returned by ``get_edge_arrays``, built here if not given
 	:return bool: whether ``position`` is in or on the boundary of the horizontal surface
 	"""
-	
+
+	p1, p2, centers, radii = edge_arrays if edge_arrays is not None else get_edge_arrays(hsurface)
+
 	# since all lists of vertices will be in counterclockwise direction, the left of the line is considered "inside"
-	for edge in hsurface:
-		# check if at a curve
-		if type(edge) is Arc:
-			if not is_in_circle(position, edge.center, edge.radius):
-				return False
-			continue
-		
-		if get_side_of_line(position, edge.p1, edge.p2) < 1:
-			return False
-		
-	return True
+	cross = (p2[:, 0] - p1[:, 0]) * (position[1] - p1[:, 1]) - (position[0] - p1[:, 0]) * (p2[:, 1] - p1[:, 1])
+	if not np.all(cross > 0):
+		return False
+
+	# at curves, the position has to be inside the circle the arc is on
+	return bool(np.all(calc_distance_batch(position[:2], centers) <= radii))
+
+
+def is_in_horizontal_surface_batch(positions: np.ndarray, hsurface: list[Edge], edge_arrays: Optional[tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]] = None) -> np.ndarray:
+	r"""Checks which of ``positions`` are in or on the boundary of a horizontal surface defined by ``hsurface``
+
+	This is the same test as ``is_in_horizontal_surface``, but every position is checked against every edge at once.
+
+	:param np.ndarray positions: an (N, 2) array of 2D coordinate points
+	:param list[Edge] hsurface: a list of ``Edges`` defining a horizontal surface
+	:param Optional[tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]] edge_arrays: the edges of ``hsurface`` as returned by ``get_edge_arrays``, built here if not given
+	:return np.ndarray: an (N,) boolean array of whether each position is in the horizontal surface
+	"""
+
+	positions = np.asarray(positions, dtype=np.float64).reshape(-1, 2)
+	p1, p2, centers, radii = edge_arrays if edge_arrays is not None else get_edge_arrays(hsurface)
+
+	# rows are positions and columns are edges
+	px = positions[:, 0, np.newaxis]
+	py = positions[:, 1, np.newaxis]
+	cross = (p2[:, 0] - p1[:, 0]) * (py - p1[:, 1]) - (px - p1[:, 0]) * (p2[:, 1] - p1[:, 1])
+
+	return np.all(cross > 0, axis=1) & np.all(calc_distance_batch(positions[:, np.newaxis], centers) <= radii, axis=1)
 
 
 def is_in_conical_surface(position: tuple[np.float64, np.float64, np.float64], hsurface: list[Edge], eae: np.float64) -> Optional[Callable[[np.float64, np.float64], np.float64]]:
@@ -326,14 +348,17 @@ def is_in_conical_surface(position: tuple[np.float64, np.float64, np.float64], h
 	if position[2] < eae + 150:
 		return None
 
+	point = position[:2]
+
 	# conical surface is generated from the perimeter of the horizontal surface
 	for edge in hsurface:
 		# at curved portions of the horizontal surface, the conical surface is actually conical
 		if type(edge) is Arc:
+			apex = (edge.center[0], edge.center[1], eae + 150)
 			# this lower bound cone is technically just a flat circle at z = eae + 150
-			cone1 = get_cone(t3d(edge.center, eae + 150), edge.radius, eae + 150)
+			cone1 = get_cone(apex, edge.radius, eae + 150)
 
-			cone2 = get_cone(t3d(edge.center, eae + 150), edge.radius + 4000, eae + 350)
+			cone2 = get_cone(apex, edge.radius + 4000, eae + 350)
 			z1 = cone1(position[0], position[1])
 			z2 = cone2(position[0], position[1])
 			if z2 <= position[2] and position[2] <= z1:
@@ -341,49 +366,56 @@ def is_in_conical_surface(position: tuple[np.float64, np.float64, np.float64], h
 			continue
 		
 		# for straight portions of the horizontal surface, the conical surface is just a wedge (i.e. a right triangular prism)
-		distance = distance_to_line(t2d(position), edge.p1, edge.p2)
+		# most edges are rejected by the 2D checks, so the plane is only built for the ones that pass them
+		if distance_to_line(point, edge.p1, edge.p2) > 4000 or not is_within_segment(point, edge.p1, edge.p2):
+			continue
+
 		t = create_right_triangle(edge.p1, edge.p2, np.float64(4000))[0]
-		t = t3d(t, eae + 350)
+		t = (t[0], t[1], eae + 350)
 
-		p13d = t3d(edge.p1, eae + 150)
-		p23d = t3d(edge.p2, eae + 150)
+		p13d = (edge.p1[0], edge.p1[1], eae + 150)
+		p23d = (edge.p2[0], edge.p2[1], eae + 150)
 
 		plane = get_plane(p13d, p23d, t)
 
-		if distance <= 4000 and is_within_segment(t2d(position), edge.p1, edge.p2) and position[2] <= plane(position[0], position[1]):
+		if position[2] <= plane(position[0], position[1]):
 			return plane
 		
 	return None
 
 
-def is_in_approach_surface(position: tuple[np.float64, np.float64, np.float64], asurface: list[tuple[np.float64, np.float64]], approach_dimensions: dict[str, np.float64], eae: np.float64) -> Optional[Callable[[np.float64, np.float64], np.float64]]:
+def is_in_approach_surface(position: tuple[np.float64, np.float64, np.float64], asurface: list[tuple[np.float64, np.float64]], approach_dimensions: ApproachDimensions, eae: np.float64, inside: Optional[bool] = None) -> Optional[Callable[[np.float64, np.float64], np.float64]]:
 	r"""Checks if ``position`` is in or on the boundary of an approach surface defined by ``asurface``
 
 	:param tuple[np.float64, np.float64, np.float64] position: a 3D coordinate point
 	:param list[tuple[np.float64, np.float64]] asurface: a list of 2D vertices bounding the approach surface
-	:param dict[str, np.float64] approach_dimensions: the dimensions of the approach surface as returned by ``Runway.calc_approach_dimensions``
+	:param ApproachDimensions approach_dimensions: the dimensions of the approach surface as returned by ``Runway.calc_approach_dimensions``
 	:param np.float64 eae: the established airport elevation
+	:param Optional[bool] inside: whether ``position`` is inside the 2D projection of ``asurface``, checked here if not given
 	:return Optional[Callable[[np.float64, np.float64], np.float64]]: a function that is the equation of a 3D surface in the form of ``z = f(x,y)`` bounding ``position`` from above
 	"""
 
-	p1 = t3d(asurface[0], eae)
-	p2 = t3d(asurface[1], eae)
+	# check if within the 2D projection of the approach surface first before checking height
+	if inside is None:
+		inside = is_in_polygon(position[:2], asurface, force_ccw=True)
+	if not inside:
+		return None
 
-	if approach_dimensions["type"] == ApproachTypes.PRECISION_INSTRUMENT:
-		# check if within the 2D projection of the approach surface first before checking height
-		if not is_in_polygon(t2d(position), asurface, force_ccw=True):
-			return None
+	p1 = (asurface[0][0], asurface[0][1], eae)
+	p2 = (asurface[1][0], asurface[1][1], eae)
 
-		h = eae + approach_dimensions["primary_slope"] * approach_dimensions["primary_length"]
-		p31 = t3d(asurface[3], h)
-		h += approach_dimensions["secondary_slope"] * approach_dimensions["secondary_length"]
-		p32 = t3d(asurface[3], h)
+	if approach_dimensions.type == ApproachTypes.PRECISION_INSTRUMENT:
+
+		h = eae + approach_dimensions.primary_slope * approach_dimensions.primary_length
+		p31 = (asurface[3][0], asurface[3][1], h)
+		h += approach_dimensions.secondary_slope * approach_dimensions.secondary_length
+		p32 = (asurface[3][0], asurface[3][1], h)
 
 		midpoint = ((asurface[0][0] + asurface[1][0]) / 2, (asurface[0][1] + asurface[1][1]) / 2)
-		t = create_right_triangle(asurface[0], midpoint, approach_dimensions["primary_length"])[0]
+		t = create_right_triangle(asurface[0], midpoint, approach_dimensions.primary_length)[0]
 		projection = proj((position[0] - midpoint[0], position[1] - midpoint[1]), (t[0] - midpoint[0], t[1] - midpoint[1]))
 		projection = (projection[0] + midpoint[0], projection[1] + midpoint[1])
-		if calc_distance(projection, midpoint) <= approach_dimensions["primary_length"]:
+		if calc_distance(projection, midpoint) <= approach_dimensions.primary_length:
 			plane = get_plane(p1, p2, p31)
 			if position[2] <= plane(position[0], position[1]):
 				return plane
@@ -392,53 +424,140 @@ def is_in_approach_surface(position: tuple[np.float64, np.float64, np.float64],
 			if position[2] <= plane(position[0], position[1]):
 				return plane
 	else:
-		h = eae + approach_dimensions["slope"] * approach_dimensions["length"]
-		p3 = t3d(asurface[3], h)
+		h = eae + approach_dimensions.slope * approach_dimensions.length
+		p3 = (asurface[3][0], asurface[3][1], h)
 		plane = get_plane(p1, p2, p3)
 		
-		if is_in_polygon(t2d(position), asurface, force_ccw=True) and position[2] <= plane(position[0], position[1]):
+		if position[2] <= plane(position[0], position[1]):
 			return plane
 	
 	return None
 
 
-def is_in_transitional_surface(position: tuple[np.float64, np.float64, np.float64], tsurface: list[tuple[np.float64, np.float64]], eae: np.float64) -> Optional[Callable[[np.float64, np.float64], np.float64]]:
+def is_in_transitional_surface(position: tuple[np.float64, np.float64, np.float64], tsurface: list[tuple[np.float64, np.float64]], eae: np.float64, inside: Optional[bool] = None) -> Optional[Callable[[np.float64, np.float64], np.float64]]:
 	r"""Checks if ``position`` is in or on the boundary of a transitional surface defined by ``tsurface`` 
 
 	:param tuple[np.float64, np.float64, np.float64] position: a 3D coordinate point
 	:param list[tuple[np.float64, np.float64]] tsurface: a list of 2D vertices bounding the transitional surface
 	:param np.float64 eae: the established airport elevation
+	:param Optional[bool] inside: whether ``position`` is inside the 2D projection of ``tsurface``, checked here if not given
 	:return Optional[Callable[[np.float64, np.float64], np.float64]]: a function that is the equation of a 3D surface in the form ``z = f(x,y)`` bounding ``position`` from above
 	"""
 
-	p1 = t3d(tsurface[0], eae)
-	p2 = t3d(tsurface[-1], eae)
-	p3 = t3d(tsurface[2], eae + 150)
+	if inside is None:
+		inside = is_in_polygon(position[:2], tsurface, force_ccw=True)
+	if not inside:
+		return None
+
+	p1 = (tsurface[0][0], tsurface[0][1], eae)
+	p2 = (tsurface[-1][0], tsurface[-1][1], eae)
+	p3 = (tsurface[2][0], tsurface[2][1], eae + 150)
 	
 	plane = get_plane(p1, p2, p3)
-	if is_in_polygon(t2d(position), tsurface, force_ccw=True) and position[2] <= plane(position[0], position[1]):
+	if position[2] <= plane(position[0], position[1]):
 		return plane
 
 	return None
 
 
-def get_zone_information(position: tuple[np.float64, np.float64, np.float64], runways: list[Runway], eae: np.float64) -> dict[str, str]:
+def get_runway_surfaces(runway: Runway) -> tuple[Mapping[RunwayEnd, ApproachDimensions], dict[RunwayEnd, list[tuple[np.float64, np.float64]]], dict[RunwayEnd, list[tuple[np.float64, np.float64]]], list[list[tuple[np.float64, np.float64]]]]:
+	r"""Gets the 2D projections of every surface that belongs to ``runway``
+
+	Each runway's surfaces only depend on that runway, so they can be built independently of every other runway.
+
+	:param Runway runway: a runway
+	:return tuple: the approach dimensions as returned by ``Runway.calc_approach_dimensions``, followed by the primary, approach, and transitional surface vertices
+	"""
+
+	approach_dimensions = runway.calc_approach_dimensions()
+	psurface = get_primary_surface_vertices(runway)
+	asurfaces = get_approach_surface_vertices(approach_dimensions, psurface)
+	tsurfaces = get_transitional_surface_vertices(psurface, asurfaces)
+
+	return approach_dimensions, psurface, asurfaces, tsurfaces
+
+
+class SurfaceCache:
+	"""Holds the 2D projections of every surface of a set of runways
+
+	None of the surfaces depend on the position being checked, so they can be built once and reused for every position.
+	"""
+
+	__slots__ = ("runways", "hsurface", "edge_arrays", "runway_surfaces", "bounding_boxes")
+
+	def __init__(self, runways: list[Runway], hsurface: list[Edge], runway_surfaces: list[tuple], bounding_boxes: list[tuple[np.float64, np.float64, np.float64, np.float64]]):
+		r"""Creates a new ``SurfaceCache`` object
+
+		:param list[Runway] runways: a list of runways
+		:param list[Edge] hsurface: the edges of the horizontal surface around ``runways`` as returned by ``get_horizontal_surface_edges``
+		:param list[tuple] runway_surfaces: the surfaces of each runway in ``runways`` as returned by ``get_runway_surfaces``
+		:param list[tuple[np.float64, np.float64, np.float64, np.float64]] bounding_boxes: the bounding box of all the surface vertices of each runway in ``runways``
+		"""
+
+		self.runways = runways
+		self.hsurface = hsurface
+		# the horizontal surface is checked through these arrays, so they're only split out once
+		self.edge_arrays = get_edge_arrays(hsurface)
+		self.runway_surfaces = runway_surfaces
+		self.bounding_boxes = bounding_boxes
+
+
+def precompute_surfaces(runways: list[Runway]) -> SurfaceCache:
+	r"""Builds every surface of ``runways`` so that many positions can be checked against them with ``get_zone_information``
+
+	:param list[Runway] runways: a list of runways
+	:return SurfaceCache: the surfaces of ``runways``
+	"""
+
+	runway_surfaces = [get_runway_surfaces(runway) for runway in runways]
+
+	# every surface of a runway is inside the bounding box of all of its vertices
+	bounding_boxes = [
+		get_bounding_box([vertex for vertices in (*psurface.values(), *asurfaces.values(), *tsurfaces) for vertex in vertices])
+		for _, psurface, asurfaces, tsurfaces in runway_surfaces
+	]
+
+	return SurfaceCache(runways, get_horizontal_surface_edges(runways), runway_surfaces, bounding_boxes)
+
+
+def get_zone_information(position: tuple[np.float64, np.float64, np.float64], runways: list[Runway], eae: np.float64, surfaces: Optional[SurfaceCache] = None) -> dict[str, str]:
 	r"""Gets the information about the imaginary zone that ``position`` is in
 
 	:param list[Runway] runways: a list of runways
 	:param tuple[np.float64, np.float64, np.float64] position: a 3D coordinate
 	:param np.float64 eae: the established airport elevation of the airport containing ``runways``
+	:param Optional[SurfaceCache] surfaces: the surfaces of ``runways`` as returned by ``precompute_surfaces``, built here if not given
+	:raises ValueError: if ``surfaces`` was built for runways other than ``runways``
 	:return dict[str, str]: a mapping of info to its value (e.g. ``"zone": "Transitional Surface"``)
 	"""
 	
+	if surfaces is None:
+		surfaces = precompute_surfaces(runways)
+	# the zones come from ``surfaces``, so using a cache built for other runways would silently give the wrong answer
+	elif surfaces.runways is not runways and list(surfaces.runways) != list(runways):
+		raise ValueError("surfaces were not built for runways")
+
+	return _get_zone_information(position, surfaces, eae, is_in_horizontal_surface(position[:2], surfaces.hsurface, edge_arrays=surfaces.edge_arrays))
+
+
+def _get_zone_information(position: tuple[np.float64, np.float64, np.float64], surfaces: SurfaceCache, eae: np.float64, in_hsurface: bool, polygon_hits: Optional[list[tuple[bool, list[bool], dict[RunwayEnd, bool]]]] = None) -> dict[str, str]:
+	r"""Gets the information about the imaginary zone that ``position`` is in once it's known whether it's in the horizontal surface
+
+	:param tuple[np.float64, np.float64, np.float64] position: a 3D coordinate
+	:param SurfaceCache surfaces: the surfaces of the runways as returned by ``precompute_surfaces``
+	:param np.float64 eae: the established airport elevation of the airport containing the runways
+	:param bool in_hsurface: whether ``position`` is in the horizontal surface
+	:param Optional[list[tuple[bool, list[bool], dict[RunwayEnd, bool]]]] polygon_hits: for each runway, whether ``position`` is in its primary surface,
+		each of its transitional surfaces, and the approach surface at each end, checked here if not given
+	:return dict[str, str]: a mapping of info to its value (e.g. ``"zone": "Transitional Surface"``)
+	"""
+
 	info = {}
 	build_limit = eae
 	info["zone"] = "N/A"
 
-	hsurface = get_horizontal_surface_edges(runways)
-	in_hsurface = True
-	if not is_in_horizontal_surface(t2d(position), hsurface):
-		in_hsurface = False
+	hsurface = surfaces.hsurface
+	point = position[:2]
 
 	if not in_hsurface:
 		func = is_in_conical_surface(position, hsurface, eae)
@@ -452,27 +571,25 @@ def get_zone_information(position: tuple[np.float64, np.float64, np.float64], ru
 		info["zone"] = "Horizontal"
 		info["build_limit"] = build_limit
 
-	for runway in runways:
-		approach_dimensions = runway.calc_approach_dimensions()
-		psurface = get_primary_surface_vertices(runway)
-		asurfaces = get_approach_surface_vertices(approach_dimensions, psurface)
-		tsurfaces = get_transitional_surface_vertices(psurface, asurfaces)
-		
+	for i, (runway, (approach_dimensions, psurface, asurfaces, tsurfaces), bbox) in enumerate(zip(surfaces.runways, surfaces.runway_surfaces, surfaces.bounding_boxes)):
+		# none of the polygon or plane checks below need to run for points outside of this runway's bounding box
+		if not is_in_bounding_box(point, bbox):
+			continue
+
+		in_psurface, in_tsurfaces, in_asurfaces = polygon_hits[i] if polygon_hits is not None else (None, [None] * len(tsurfaces), {})
+
 		if in_hsurface:
-			t = list(psurface.values())
-			v = []
-			for i in t:
-				for j in i:
-					v.append(j)
-			
-			if is_in_polygon(t2d(position), v):
+			if in_psurface is None:
+				in_psurface = is_in_polygon(point, [vertex for vertices in psurface.values() for vertex in vertices])
+
+			if in_psurface:
 				info["runway"] = runway.name
 				info["zone"] = "Primary"
 				info["build_limit"] = eae
 				return info
 			
-			for tsurface in tsurfaces:
-				func = is_in_transitional_surface(position, tsurface, eae)
+			for tsurface, inside in zip(tsurfaces, in_tsurfaces):
+				func = is_in_transitional_surface(position, tsurface, eae, inside=inside)
 				if func is None:
 					continue
 				
@@ -483,9 +600,9 @@ def get_zone_information(position: tuple[np.float64, np.float64, np.float64], ru
 					info["zone"] = "Transitional"
 					info["build_limit"] = build_limit
 		
-		for end, asurface in list(asurfaces.items()):
+		for end, asurface in asurfaces.items():
 			ainfo = approach_dimensions[end]
-			func = is_in_approach_surface(position, asurface, ainfo, eae)
+			func = is_in_approach_surface(position, asurface, ainfo, eae, inside=in_asurfaces.get(end))
 			if func is None:
 				continue
 			
@@ -497,4 +614,39 @@ def get_zone_information(position: tuple[np.float64, np.float64, np.float64], ru
 				info["end"] = end.name
 				info["build_limit"] = build_limit
 
-	return info
\ No newline at end of file
+	return info
+
+
+def get_zone_information_batch(positions: np.ndarray, runways: list[Runway], eae: np.float64) -> list[dict[str, str]]:
+	r"""Gets the information about the imaginary zone that each position in ``positions`` is in
+
+	The surfaces of ``runways`` are only built once for all of the positions,
+	and every position is checked against each surface's 2D projection at once.
+
+	:param np.ndarray positions: an (N, 3) array of 3D coordinates
+	:param list[Runway] runways: a list of runways
+	:param np.float64 eae: the established airport elevation of the airport containing ``runways``
+	:return list[dict[str, str]]: the zone information of each position, in the same order as ``positions``
+	"""
+
+	surfaces = precompute_surfaces(runways)
+
+	# the horizontal surface check is done for every position at once
+	positions = np.asarray(positions, dtype=np.float64).reshape(-1, 3)
+	in_hsurface = is_in_horizontal_surface_batch(positions[:, :2], surfaces.hsurface, edge_arrays=surfaces.edge_arrays)
+
+	# so are the primary, transitional, and approach surface polygons of every runway
+	hits = []
+	for _, psurface, asurfaces, tsurfaces in surfaces.runway_surfaces:
+		hits.append((
+			is_in_polygon_batch(positions[:, :2], [vertex for vertices in psurface.values() for vertex in vertices]),
+			[is_in_polygon_batch(positions[:, :2], tsurface, force_ccw=True) for tsurface in tsurfaces],
+			{end: is_in_polygon_batch(positions[:, :2], asurface, force_ccw=True) for end, asurface in asurfaces.items()},
+		))
+
+	return [
+		_get_zone_information(tuple(position), surfaces, eae, bool(inside), polygon_hits=[
+			(bool(p[j]), [bool(t[j]) for t in ts], {end: bool(a[j]) for end, a in asf.items()}) for p, ts, asf in hits
+		])
+		for j, (position, inside) in enumerate(zip(positions, in_hsurface))
+	]
@@ -1,8 +1,10 @@
+import math
 import numpy as np
-from sympy.geometry import Point2D, Line2D, Segment2D, Polygon, Point
-from functools import cmp_to_key
 from typing import Callable
 
+# approximate conversion factor used by ``degrees_to_feet`` and ``degrees_to_feet_batch``
+FEET_PER_DEG_LAT = 364000
+
 def extend_point_in_one_direction(p1: tuple[np.float64, np.float64], p2: tuple[np.float64, np.float64], amount: np.float64) -> tuple[np.float64, np.float64]:
 	r"""Extends ``p2`` in the direction of ``p1`` to ``p2`` by ``amount``
 
@@ -17,8 +19,9 @@ def extend_point_in_one_direction(p1: tuple[np.float64, np.float64], p2: tuple[n
 	"""
 
 	# translate to the origin
-	v = np.subtract(p2, p1)
-	length = np.linalg.norm(v)
+	dx = p2[0] - p1[0]
+	dy = p2[1] - p1[1]
+	length = math.hypot(dx, dy)
 
 	if length == 0:
 		return tuple()
@@ -27,12 +30,9 @@ def extend_point_in_one_direction(p1: tuple[np.float64, np.float64], p2: tuple[n
 	# let l be param `amount`
 	# scale the vector such that $$ |\vec{v}| = \overrightarrow{P_{1}P_{2}} + l $$
 	a = amount / length + 1
-	v = a * v
 
 	# translate back
-	v = np.add(v, p1)
-
-	return tuple(v)
+	return (p1[0] + a * dx, p1[1] + a * dy)
 
 
 def extend_points_in_both_directions(p1: tuple[np.float64, np.float64], p2: tuple[np.float64, np.float64], amount: np.float64) -> list[tuple[np.float64, np.float64]]:
@@ -47,14 +47,53 @@ def extend_points_in_both_directions(p1: tuple[np.float64, np.float64], p2: tupl
 	:return list[tuple[np.float64, np.float64]]: the endpoints of the extended line segment 
 	"""
 
-	extended2 = extend_point_in_one_direction(p1, p2, amount)
-	extended1 = extend_point_in_one_direction(p2, p1, amount)
+	# both ends are extended along the same line, so its direction and length are only calculated once
+	# (see ``extend_point_in_one_direction``)
+	dx = p2[0] - p1[0]
+	dy = p2[1] - p1[1]
+	length = math.hypot(dx, dy)
 
-	if len(extended1) == 0 or len(extended2) == 0:
+	if length == 0:
 		return []
 	
-	return [extended1, extended2]
+	a = amount / length + 1
+	return [(p2[0] - a * dx, p2[1] - a * dy), (p1[0] + a * dx, p1[1] + a * dy)]
+
+
+def extend_points_in_both_directions_batch(p1: np.ndarray, p2: np.ndarray, amount: np.float64) -> tuple[np.ndarray, np.ndarray]:
+	r"""Extends many line segments at once
+
+	This is the same as ``extend_points_in_both_directions``, but for (N, 2) arrays of the endpoints of N line segments.
+	Line segments with no length can't be extended, so their extended endpoints are ``nan``.
+
+	:param np.ndarray p1: an (N, 2) array of 2D coordinate points
+	:param np.ndarray p2: an (N, 2) array of 2D coordinate points
+	:param np.float64 amount: the amount to extend each line segment by
+	:return tuple[np.ndarray, np.ndarray]: the extensions of ``p1`` and ``p2`` as (N, 2) arrays
+	"""
 
+	p1 = np.asarray(p1, dtype=np.float64).reshape(-1, 2)
+	p2 = np.asarray(p2, dtype=np.float64).reshape(-1, 2)
+	d = p2 - p1
+
+	with np.errstate(divide="ignore", invalid="ignore"):
+		length = np.hypot(d[:, 0], d[:, 1])[:, np.newaxis]
+		a = np.where(length == 0, np.nan, amount / length + 1)
+
+	return p2 + a * (p1 - p2), p1 + a * d
+
+
+# the signs of the horizontal and vertical offsets of ``cet2cr``'s tangent points for each case.
+# the colors correspond to color coded lines on desmos when i was constructing these points
+# see: https://desmos.com/calculator
+_CET2CR_SIGNS = {
+	(True, 0): (-1, 1),  # green
+	(True, 1): (1, 1),  # red
+	(True, 2): (1, -1),  # orange
+	(False, 0): (1, -1),  # orange
+	(False, 1): (-1, -1),  # blue
+	(False, 2): (-1, 1),  # green
+}
 
 def cet2cr(c1: tuple[np.float64, np.float64], r1: np.float64, c2: tuple[np.float64, np.float64], r2: np.float64) -> list[tuple[np.float64, np.float64]]:
 	r"""Gets the common external tangent line on the right side of two circles
@@ -74,9 +113,7 @@ def cet2cr(c1: tuple[np.float64, np.float64], r1: np.float64, c2: tuple[np.float
 
 	# if the centers of each circle are identical, then there are no possible common tangents
 	# or, if one circle is completely inside of another, then there are also no possible common tangents
-	if np.array_equal(c1, c2):
-		return []
-	elif circle_in_circle(c1, r1, c2, r2):
+	if (c1[0] == c2[0] and c1[1] == c2[1]) or circle_in_circle(c1, r1, c2, r2):
 		return []
 	
 	# solutions thanks to the help John Alexiou on Math Stack Exchange
@@ -99,60 +136,95 @@ def cet2cr(c1: tuple[np.float64, np.float64], r1: np.float64, c2: tuple[np.float
 	a = c2[1] - c1[1]
 	b = c1[0] - c2[0]
 	c = r2 - r1
-	m = np.linalg.norm(np.array([a, b]))
-	# arcsin is odd, so negating it is equivalent to negating c which just changes the side of the circles the common tangent line is on
-	theta = -np.arctan(a/b) - np.arcsin(c/m)
-
-	# if r1 > r2, the inequalities need to be flipped
-	f = 1
-	if r1 > r2:
-		f = -1
-
-	# the comments with colors correspond to color coded lines on desmos when i was constructing these points
-	# see: https://desmos.com/calculator
-	if c1[1] >= c2[1]:
-		if r1 < r2:
-			if c1[0] >= c2[0]:
-				# green
-				return [(c1[0] - r1 * np.sin(theta), c1[1] + np.sqrt(-(r1**2) * ((np.sin(theta))**2 - 1))), (c2[0] - r2 * np.sin(theta), c2[1] + np.sqrt(-(r2**2) * ((np.sin(theta))**2 - 1)))]
-			elif c1[0] >= c2[0] - r2 + r1:
-				# red
-				return [(c1[0] + r1 * np.sin(theta), c1[1] + np.sqrt(-(r1**2) * ((np.sin(theta))**2 - 1))), (c2[0] + r2 * np.sin(theta), c2[1] + np.sqrt(-(r2**2) * ((np.sin(theta))**2 - 1)))]
-			else:
-				# orange
-				return [(c1[0] + r1 * np.sin(theta), c1[1] - np.sqrt(-(r1**2) * ((np.sin(theta))**2 - 1))), (c2[0] + r2 * np.sin(theta), c2[1] - np.sqrt(-(r2**2) * ((np.sin(theta))**2 - 1)))]
-		else:
-			if c1[0] < c2[0]:
-				# orange
-				return [(c1[0] + r1 * np.sin(theta), c1[1] - np.sqrt(-(r1**2) * ((np.sin(theta))**2 - 1))), (c2[0] + r2 * np.sin(theta), c2[1] - np.sqrt(-(r2**2) * ((np.sin(theta))**2 - 1)))]
-			elif c1[0] <= c2[0] - r2 + r1:
-				# blue
-				return [(c1[0] - r1 * np.sin(theta), c1[1] - np.sqrt(-(r1**2) * ((np.sin(theta))**2 - 1))), (c2[0] - r2 * np.sin(theta), c2[1] - np.sqrt(-(r2**2) * ((np.sin(theta))**2 - 1)))]		
-			else:
-				# green
-				return [(c1[0] - r1 * np.sin(theta), c1[1] + np.sqrt(-(r1**2) * ((np.sin(theta))**2 - 1))), (c2[0] - r2 * np.sin(theta), c2[1] + np.sqrt(-(r2**2) * ((np.sin(theta))**2 - 1)))]
+	m = math.hypot(a, b)
+	# atan2 doesn't divide by b, which is 0 when the centers are vertically aligned.
+	# negating both arguments when b is negative keeps alpha in the range of arctan that the cases below are built around
+	alpha = math.atan2(a, b) if b >= 0 else math.atan2(-a, -b)
+	# arcsin is odd, so negating it is equivalent to negating c which just changes the side of the circles the common tangent line is on.
+	# rounding can push c/m just past 1 for circles that are internally tangent
+	theta = -alpha - math.asin(max(-1.0, min(1.0, c / m)))
+
+	# every tangent point is offset from its circle's center by $$ r\sin(\theta) $$ horizontally and $$ r|\cos(\theta)| $$ vertically,
+	# so the offsets are only calculated once and each case below just picks their signs
+	s = math.sin(theta)
+	# $$ |\cos(\theta)| $$, shared by both vertical offsets
+	cos = math.sqrt(1 - s**2)
+	x1 = r1 * s
+	x2 = r2 * s
+	y1 = r1 * cos
+	y2 = r2 * cos
+
+	# when c1 is above c2 and smaller, or below c2 and not smaller, the cases are green, red, then orange from right to left.
+	# otherwise they're orange, blue, then green from left to right
+	upper = c1[1] >= c2[1]
+	same = upper == (r1 < r2)
+	threshold = c2[0] - r2 + r1 if upper else c2[0] + r2 - r1
+	if same:
+		case = 0 if c1[0] >= c2[0] else 1 if c1[0] >= threshold else 2
 	else:
-		if r1 < r2:
-			if c1[0] < c2[0]:
-				# orange
-				return [(c1[0] + r1 * np.sin(theta), c1[1] - np.sqrt(-(r1**2) * ((np.sin(theta))**2 - 1))), (c2[0] + r2 * np.sin(theta), c2[1] - np.sqrt(-(r2**2) * ((np.sin(theta))**2 - 1)))]
-			elif c1[0] <= c2[0] + r2 - r1:
-				# blue
-				return [(c1[0] - f * r1 * np.sin(theta), c1[1] - np.sqrt(-(r1**2) * ((np.sin(theta))**2 - 1))), (c2[0] - f * r2 * np.sin(theta), c2[1] - f * np.sqrt(-(r2**2) * ((np.sin(theta))**2 - 1)))]
-			else:
-				# green
-				return [(c1[0] - r1 * np.sin(theta), c1[1] + np.sqrt(-(r1**2) * ((np.sin(theta))**2 - 1))), (c2[0] - r2 * np.sin(theta), c2[1] + np.sqrt(-(r2**2) * ((np.sin(theta))**2 - 1)))]	
-		else:
-			if c1[0] >= c2[0]:
-				# green
-				return [(c1[0] - r1 * np.sin(theta), c1[1] + np.sqrt(-(r1**2) * ((np.sin(theta))**2 - 1))), (c2[0] - r2 * np.sin(theta), c2[1] + np.sqrt(-(r2**2) * ((np.sin(theta))**2 - 1)))]	
-
-			elif c1[0] >= c2[0] + r2 - r1:
-				# red
-				return [(c1[0] + r1 * np.sin(theta), c1[1] + np.sqrt(-(r1**2) * ((np.sin(theta))**2 - 1))), (c2[0] + r2 * np.sin(theta), c2[1] + np.sqrt(-(r2**2) * ((np.sin(theta))**2 - 1)))]
-			else:
-				# orange
-				return [(c1[0] + r1 * np.sin(theta), c1[1] - np.sqrt(-(r1**2) * ((np.sin(theta))**2 - 1))), (c2[0] + r2 * np.sin(theta), c2[1] - np.sqrt(-(r2**2) * ((np.sin(theta))**2 - 1)))]
+		case = 0 if c1[0] < c2[0] else 1 if c1[0] <= threshold else 2
+
+	sx, sy = _CET2CR_SIGNS[same, case]
+	return [(c1[0] + sx * x1, c1[1] + sy * y1), (c2[0] + sx * x2, c2[1] + sy * y2)]
+
+
+def cet2cr_batch(c1: np.ndarray, r1: np.ndarray, c2: np.ndarray, r2: np.ndarray) -> np.ndarray:
+	r"""Gets the right-side common external tangent lines of many pairs of circles at once
+
+	This is the same as ``cet2cr``, but for N pairs of circles given as (N, 2) arrays of centers and (N,) arrays of radii.
+	Pairs that don't have a common tangent (identical centers or one circle inside of the other) are ``nan``.
+
+	:param np.ndarray c1: an (N, 2) array of the centerpoints of the first circle of each pair
+	:param np.ndarray r1: an (N,) array of the radii of the circles centered at ``c1``
+	:param np.ndarray c2: an (N, 2) array of the centerpoints of the second circle of each pair
+	:param np.ndarray r2: an (N,) array of the radii of the circles centered at ``c2``
+	:return np.ndarray: an (N, 2, 2) array of the 2D coordinate points on each circle that each common tangent line passes through
+	"""
+
+	c1 = np.asarray(c1, dtype=np.float64).reshape(-1, 2)
+	c2 = np.asarray(c2, dtype=np.float64).reshape(-1, 2)
+	r1 = np.broadcast_to(np.asarray(r1, dtype=np.float64), (len(c1),))
+	r2 = np.broadcast_to(np.asarray(r2, dtype=np.float64), (len(c1),))
+	c1x, c1y = c1[:, 0], c1[:, 1]
+	c2x, c2y = c2[:, 0], c2[:, 1]
+
+	# see ``cet2cr`` for the derivation
+	a = c2y - c1y
+	b = c1x - c2x
+	m = np.hypot(a, b)
+	# the same test as ``circle_in_circle``, so both versions agree on nearly tangent circles.
+	# circles with identical centers always pass it
+	invalid = (r1 - r2)**2 >= b * b + a * a
+
+	with np.errstate(divide="ignore", invalid="ignore"):
+		alpha = np.arctan2(np.where(b < 0, -a, a), np.abs(b))
+		theta = -alpha - np.arcsin(np.clip((r2 - r1) / m, -1.0, 1.0))
+	s = np.sin(theta)
+	cos = np.sqrt(1 - s**2)
+	x1 = r1 * s
+	x2 = r2 * s
+	y1 = r1 * cos
+	y2 = r2 * cos
+
+	# the cases of ``cet2cr`` only differ in the signs of the offsets, which are the same for both circles.
+	# when c1 is above c2 and smaller, or below c2 and not smaller, the cases are green, red, then orange from right to left.
+	# otherwise they're orange, blue, then green from left to right
+	same = (c1y >= c2y) == (r1 < r2)
+	right = c1x >= c2x
+	threshold = np.where(c1y >= c2y, c2x - r2 + r1, c2x + r2 - r1)
+	cases = [same & right, same & (c1x >= threshold), same, ~right, c1x <= threshold]
+	# green: (-, +), red: (+, +), orange: (+, -), blue: (-, -)
+	sx = np.select(cases, [-1, 1, 1, 1, -1], default=-1)
+	sy = np.select(cases, [1, 1, -1, -1, -1], default=1)
+
+	tangents = np.empty((len(c1), 2, 2), dtype=np.float64)
+	tangents[:, 0, 0] = c1x + sx * x1
+	tangents[:, 0, 1] = c1y + sy * y1
+	tangents[:, 1, 0] = c2x + sx * x2
+	tangents[:, 1, 1] = c2y + sy * y2
+	tangents[invalid] = np.nan
+
+	return tangents
 
 
 def get_higher_point(a: tuple[np.float64, np.float64], b: tuple[np.float64, np.float64]) -> tuple[np.float64, np.float64]:
@@ -196,12 +268,27 @@ def circle_in_circle(c1: tuple[np.float64, np.float64], r1: np.float64, c2: tupl
 	"""
 
 	# if the distance between the centerpoints plus the radius of circle #1 is less than or equal to the radius of the circle #2,
-	# then circle #1 is inside circle #2
-	d = calc_distance(c1, c2)
-	if r1 >= (d + r2) or r2 >= (d + r1):
-		return True
-	
-	return False
+	# then circle #1 is inside circle #2.
+	# that's the same as the distance being at most the difference of the radii, which can be compared squared without a sqrt
+	dx = c1[0] - c2[0]
+	dy = c1[1] - c2[1]
+	return bool((r1 - r2)**2 >= dx * dx + dy * dy)
+
+
+def circle_in_circle_batch(c: np.ndarray, r: np.ndarray) -> np.ndarray:
+	r"""Checks every pair of circles for whether either circle is completely inside the other
+
+	This is the same test as ``circle_in_circle``, but for every pair of circles at once.
+
+	:param np.ndarray c: an (N, 2) array of 2D centerpoints of circles
+	:param np.ndarray r: an (N,) array of the radius of each circle
+	:return np.ndarray: an (N, N) boolean array where entry ``[i, j]`` is whether either circle ``i`` or circle ``j`` is completely inside the other
+	"""
+
+	dx = c[:, np.newaxis, 0] - c[np.newaxis, :, 0]
+	dy = c[:, np.newaxis, 1] - c[np.newaxis, :, 1]
+
+	return (r[:, np.newaxis] - r[np.newaxis, :])**2 >= dx * dx + dy * dy
 
 
 def compute_centerpoint(points: list[tuple[np.float64, np.float64]]) -> tuple[np.float64, np.float64]:
@@ -216,15 +303,10 @@ def compute_centerpoint(points: list[tuple[np.float64, np.float64]]) -> tuple[np
 
 	if len(points) == 0:
 		return tuple()
-	
-	xsum = 0
-	ysum = 0
 
-	for point in points:
-		xsum += point[0]
-		ysum += point[1]
+	center = np.mean(np.asarray(points, dtype=np.float64), axis=0)
 
-	return (np.float64(xsum) / len(points), np.float64(ysum) / len(points))
+	return (center[0], center[1])
 
 
 def sort_directional(points: list[tuple[np.float64, np.float64]], ccw: bool = True) -> None:
@@ -237,150 +319,56 @@ def sort_directional(points: list[tuple[np.float64, np.float64]], ccw: bool = Tr
 	:param bool ccw: whether to set the direction to counter-clockwise, defaults to True
 	"""
 
-	if len(points) == 0:
-		return
-	
-	center = compute_centerpoint(points)
-	assert len(center) != 0
-
-	# comparison function thanks to ciamej and arghavan on Stack Overflow
-	# https://stackoverflow.com/a/6989383
-	def compare_points(a, b):
-		if a[0] - center[0] >= 0 and b[0] - center[0] < 0:
-			return -1
-		elif a[0] - center[0] < 0 and b[0] - center[0] >= 0:
-			return 1
-		elif a[0] - center[0] == 0 and b[0] - center[0] == 0:
-			if a[1] - center[1] >= 0 or b[1] - center[1] >= 0:
-				return np.sign(b[1] - a[1])
-			return np.sign(a[1] - b[1])
-		
-		det = np.linalg.det([np.subtract(a, center), np.subtract(b, center)])
-		if det != 0:
-			return np.sign(det)
-		
-		d1 = calc_distance(a, center)
-		d2 = calc_distance(b, center)
-		return np.sign(d2 - d1)
-	
-	points.sort(key=cmp_to_key(compare_points), reverse=ccw)
+	points[:] = [points[i] for i in argsort_directional(points, ccw=ccw)]
 
 
-def lisl(a: tuple[np.float64, np.float64], b: tuple[np.float64, np.float64], c: tuple[np.float64, np.float64], d: tuple[np.float64, np.float64]) -> list[Point2D]:
-	r"""Checks if the line passing through ``a`` and ``b`` intersects the line pasing through ``c`` and ``d``
-	``lisl`` translates to "line intersects line".
+def argsort_directional(points: list[tuple[np.float64, np.float64]], ccw: bool = True) -> np.ndarray:
+	r"""Gets the indices that would sort a list of 2D coordinate points either clockwise or counter-clockwise
 
-	:param tuple[np.float64, np.float64] a: a 2D coordinate point
-	:param tuple[np.float64, np.float64] b: a 2D coordinate point
-	:param tuple[np.float64, np.float64] c: a 2D coordinate point
-	:param tuple[np.float64, np.float64] d: a 2D coordinate point
-	:return list[Point2D]: a list of every intersection point
+	The order is the same as ``sort_directional``: clockwise starting from 12 o'clock about the center of the points,
+	with the farther point first when two points are at the same angle, and reversed for counter-clockwise.
+	
+	:param list[tuple[np.float64, np.float64]] points: a list of 2D coordinate points
+	:param bool ccw: whether to set the direction to counter-clockwise, defaults to True
+	:return np.ndarray: the indices of ``points`` in sorted order
 	"""
 
-	line1 = Line2D(Point2D(a), Point2D(b))
-	line2 = Line2D(Point2D(c), Point2D(d))
-	return line1.intersection(line2)
-
-
-def lis_4p(a: tuple[np.float64, np.float64], b: tuple[np.float64, np.float64], c: tuple[np.float64, np.float64], d: tuple[np.float64, np.float64]) -> list[Point2D]:
-	r"""Checks if the line passing through ``a`` and ``b`` intersects the line segment defined by ``c`` and ``d``
-
-	``list_4p`` translates to "line intersects segment 4 points".
+	p = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+	if len(p) == 0:
+		return np.empty(0, dtype=np.intp)
 	
-	:param tuple[np.float64, np.float64] a: a 2D coordinate point
-	:param tuple[np.float64, np.float64] b: a 2D coordinate point
-	:param tuple[np.float64, np.float64] c: a 2D coordinate point
-	:param tuple[np.float64, np.float64] d: a 2D coordinate point
-	:return list[Point2D]: a list of every intersection point
-	"""
+	center = np.mean(p, axis=0)
+	dx = p[:, 0] - center[0]
+	dy = p[:, 1] - center[1]
 
-	line = Line2D(Point2D(a), Point2D(b))
-	segment = Segment2D(Point2D(c), Point2D(d))
-	return line.intersection(segment)
+	# the angle clockwise from 12 o'clock is in [0, pi] for points right of or directly above/below the center
+	# and in (pi, 2pi) for points left of it
+	theta = np.arctan2(dx, dy) % (2 * np.pi)
+	order = np.lexsort((-(dx * dx + dy * dy), theta))
 
+	return order[::-1] if ccw else order
 
-def lis_3p(a: tuple[np.float64, np.float64], slope: np.float64, c: tuple[np.float64, np.float64], d: tuple[np.float64, np.float64]) -> list[Point2D]:
-	r"""Checks if the line passing through ``a`` with ``slope`` intersects the line segment defined by ``c`` and ``d``
 
-	``list_3p`` translates to "line intersects segment 3 points".
-	
-	:param tuple[np.float64, np.float64] a: a 2D coordinate point
-	:param tuple[np.float64, np.float64] slope: the slope of a 2D line
-	:param tuple[np.float64, np.float64] c: a 2D coordinate point
-	:param tuple[np.float64, np.float64] d: a 2D coordinate point
-	:return list[Point2D]: a list of every intersection point
-	"""
+def get_signed_distances(a: tuple[np.float64, np.float64], b: tuple[np.float64, np.float64], p: np.ndarray) -> np.ndarray:
+	r"""Gets the signed distance from the line passing through ``a`` and ``b`` to each of ``p``
 
-	line = Line2D(a, slope)
-	segment = Segment2D(Point2D(c), Point2D(d))
-	return line.intersection(segment)
+	Points to the left of the vector from ``a`` to ``b`` have a positive distance, and points to the right have a negative distance.
+	``a`` and ``b`` can also be arrays of shape (..., 2) to measure against many lines at once,
+	in which case the result has shape (..., N). Degenerate lines give ``nan`` or ``inf``.
 
-def line_intersects_circle(a: np.float64, b: np.float64, c: np.float64, p: tuple[np.float64, np.float64], r: np.float64) -> list[tuple[np.float64, np.float64]]:
-	r"""Checks if a line intersects the circle centered at ``c`` with radius ``r``
-	
-	The line in question is a line in standard form :math:`ax + by + c = 0` where a = ``a``, b = ``b``, and c = ``c``.
-	When solving the system of equations, a quadratic is solved using the quadratic formula.
-	If the determinant is greater than or equal to 0, then the result will be a real number.
-	Subsequently, the line and circle will intersect (ignoring edge cases).
-	
-	:param np.float64 a: `a` in the standard-form line equation
-	:param np.float64 b: `b` in the standard-form line equation
-	:param np.float64 c: `c` in the standard-form line equation
-	:param tuple[np.float64, np.float64] p: a 2D centerpoint of a circle
-	:param np.float64 r: the radius of the circle centered at ``p``
-	:return list[tuple[np.float64, np.float64]]: a list of every intersection point
+	:param tuple[np.float64, np.float64] a: a 2D coordinate point, or an array of them
+	:param tuple[np.float64, np.float64] b: a 2D coordinate point, or an array of them
+	:param np.ndarray p: an (N, 2) array of 2D coordinate points
+	:return np.ndarray: an (N,) array of the signed distance from the line to each point, or (..., N) for many lines
 	"""
 
-	# if a and b are 0, then it isn't a line
-	if a == 0 and b == 0:
-		return []
-	# vertical line
-	elif b == 0:
-		x = -c/a
-		if p[0] - r <= x and x <= p[0] + r:
-			temp = np.sqrt(r**2 - (x - p[0])**2)
-			return [(x, p[1] + temp), (x, p[1] - temp)]
-		return []
-	# horizontal line
-	elif a == 0:
-		y = -c/b
-		if p[1] - r <= y and y <= p[1] + r:
-			temp = np.sqrt(r**2 - (y - p[1])**2)
-			return [(p[0] + temp, y), (p[0] - temp, y)]
-		return []
-	
-	# solving the system:
-	#
-	# $$ \left\{\begin{array}{l} ax + by = 0\\ (x - x_{0})^2 + (y - y_0)^2 = r^2 \end{array}\right. $$
-	#
-	# gives the following solution
-	#
-	#
-	# $$ \large\begin{array}{l} x = \frac{-\beta \pm \sqrt{\beta^2 - \alpha\gamma}}{\alpha}\\ y = \frac{-\alpha c - a(-\beta \pm \sqrt{\beta^2 - \alpha\gamma})}{\alpha b}\\ \end{array} $$
-	#
-	#
-	# where
-	#
-	#
-	# $$ \begin{array}{l} \alpha = a^2 + b^2\\ \beta = ac + aby_{0} - b^2x_{0}\\ \gamma = b^2(x_{0}^2+y_{0}^2-r^2) + 2bcy_{0} + c^2 \end{array} $$
-	#
-	#
-
-	alpha = a**2 + b**2
-	beta = a * c + a * b * p[1] - p[0] * b**2
-	gamma = (b**2) * ((p[0])**2 + (p[1])**2 - r**2) + 2 * c * b * p[1] + c**2
-	disc = beta**2 - alpha * gamma
+	a = np.asarray(a, dtype=np.float64)[..., np.newaxis, :]
+	b = np.asarray(b, dtype=np.float64)[..., np.newaxis, :]
+	dx = b[..., 0] - a[..., 0]
+	dy = b[..., 1] - a[..., 1]
 
-	if disc < 0:
-		return []
-	elif disc == 0:
-		return [(-beta/alpha, (-alpha * c + a * beta) / (alpha * b))]
-	
-	temp = np.sqrt(disc)
-	x1, y1 = (-beta + temp) / alpha, (-alpha * c - a * (-beta + temp)) / (alpha * b)
-	x2, y2 = (-beta - temp) / alpha, (-alpha * c - a * (-beta - temp)) / (alpha * b)
-
-	return [(x1, y1), (x2, y2)]
+	with np.errstate(divide="ignore", invalid="ignore"):
+		return (dx * (p[:, 1] - a[..., 1]) - (p[:, 0] - a[..., 0]) * dy) / np.hypot(dx, dy)
 
 
 def create_right_triangle(a: tuple[np.float64, np.float64], b: tuple[np.float64, np.float64], w: np.float64) -> list[tuple[np.float64, np.float64]]:
@@ -401,15 +389,18 @@ def create_right_triangle(a: tuple[np.float64, np.float64], b: tuple[np.float64,
 
 	dx = b[0] - a[0]
 	dy = b[1] - a[1]
-	l = calc_distance(a, b)
+	l = math.hypot(dx, dy)
 
 	if l == 0:
 		return []
 	
+	# both points are offset from b by the same amount in opposite directions
+	ox = (w * dy) / l
+	oy = (w * dx) / l
 	# 90 deg
-	c1 = (b[0] - (w * dy) / l, b[1] + (w * dx) / l)
+	c1 = (b[0] - ox, b[1] + oy)
 	# -90 deg
-	c2 = (b[0] + (w * dy) / l, b[1] - (w * dx) / l)
+	c2 = (b[0] + ox, b[1] - oy)
 
 	return [c1, c2]
 
@@ -436,7 +427,25 @@ def calc_distance(p1: tuple[np.float64, np.float64], p2: tuple[np.float64, np.fl
 	:return np.float64: the distance between ``p1`` and ``p2``
 	"""
 	
-	return np.float64(np.linalg.norm(np.subtract(p1, p2)))
+	# math.hypot avoids allocating an array for what is a single 2D distance
+	return np.float64(math.hypot(p1[0] - p2[0], p1[1] - p2[1]))
+
+
+def calc_distance_batch(p1: np.ndarray, p2: np.ndarray) -> np.ndarray:
+	r"""Calculates the distances between many pairs of 2D coordinate points at once
+
+	This is the same as ``calc_distance``, but ``p1`` and ``p2`` are arrays of points whose last axis has length 2.
+	They're broadcast against each other, so an (N, 1, 2) array and an (M, 2) array give every pairwise distance.
+
+	:param np.ndarray p1: an array of 2D coordinate points
+	:param np.ndarray p2: an array of 2D coordinate points
+	:return np.ndarray: the distance between each pair of points in ``p1`` and ``p2``
+	"""
+
+	p1 = np.asarray(p1, dtype=np.float64)
+	p2 = np.asarray(p2, dtype=np.float64)
+
+	return np.hypot(p1[..., 0] - p2[..., 0], p1[..., 1] - p2[..., 1])
 
 
 def get_polygon_direction(vertices: list[tuple[np.float64, np.float64]]) -> int:
@@ -450,13 +459,20 @@ def get_polygon_direction(vertices: list[tuple[np.float64, np.float64]]) -> int:
 	:return int: the orientation of ``vertices``
 	"""
 
+	if len(vertices) == 0:
+		return 0
+
+	# shoelace sum over every edge, walking the vertices pairwise instead of indexing with a modulo.
+	# the closing edge from the last vertex back to the first is still added last
 	a = 0
-	for i in range(len(vertices)):
-		v1 = vertices[i]
-		v2 = vertices[(i + 1) % len(vertices)]
+	v1 = vertices[0]
+	for v2 in vertices[1:]:
 		a += (v2[0] - v1[0]) * (v2[1] + v1[1])
+		v1 = v2
+	v2 = vertices[0]
+	a += (v2[0] - v1[0]) * (v2[1] + v1[1])
 	
-	return np.sign(a)
+	return int(a > 0) - int(a < 0)
 
 
 def get_side_of_line(a: tuple[np.float64, np.float64], b: tuple[np.float64, np.float64], c: tuple[np.float64, np.float64]) -> int:
@@ -472,7 +488,9 @@ def get_side_of_line(a: tuple[np.float64, np.float64], b: tuple[np.float64, np.f
 	:return int: what side ``c`` is on relative to the line from ``a`` to ``b``
 	"""
 
-	return np.sign(np.linalg.det([[b[0] - a[0], c[0] - a[0]], [b[1] - a[1], c[1] - a[1]]]))
+	# the determinant of the 2x2 matrix of the vectors from ``a`` to ``b`` and ``a`` to ``c``
+	det = (b[0] - a[0]) * (c[1] - a[1]) - (c[0] - a[0]) * (b[1] - a[1])
+	return int(det > 0) - int(det < 0)
 
 
 def is_in_polygon(point: tuple[np.float64, np.float64], vertices: list[tuple[np.float64, np.float64]], force_ccw: bool = False, force_cw: bool = False) -> bool:
@@ -500,17 +518,84 @@ def is_in_polygon(point: tuple[np.float64, np.float64], vertices: list[tuple[np.
 	if direction == 0:
 		return point[1] == ((vertices[1][0] - vertices[0][0])/(vertices[1][1] - vertices[0][1])) * (point[0] - vertices[0][0]) + vertices[0][1]
 
-	for i in range(len(vertices)):
-		if direction == 1:
-			if get_side_of_line(vertices[i], vertices[(i + 1) % len(vertices)], point) > -1:
-				return False
-		else:
-			if get_side_of_line(vertices[i], vertices[(i + 1) % len(vertices)], point) < 1:
-				return False
+	# the side test of ``get_side_of_line`` is inlined since this loop runs for every polygon in every zone check
+	# a point inside a clockwise polygon is on the right of every edge (cross < 0),
+	# and a point inside a counterclockwise polygon is on the left of every edge (cross > 0)
+	# every edge is checked, so starting with the closing edge from the last vertex avoids a modulo on every step
+	px, py = point[0], point[1]
+	a = vertices[-1]
+	for b in vertices:
+		cross = (b[0] - a[0]) * (py - a[1]) - (px - a[0]) * (b[1] - a[1])
+		if cross * direction >= 0:
+			return False
+		a = b
 
 	return True
 
 
+def is_in_polygon_batch(points: np.ndarray, vertices: list[tuple[np.float64, np.float64]], force_ccw: bool = False, force_cw: bool = False) -> np.ndarray:
+	r"""Checks which of ``points`` are inside the polygon defined by ``vertices``
+
+	This is the same test as ``is_in_polygon``, but every point is checked against every edge at once.
+
+	:param np.ndarray points: an (N, 2) array of 2D coordinate points
+	:param list[tuple[np.float64, np.float64]] vertices: a list of 2D coordinate points representing vertices of a polygon
+	:param bool force_ccw: whether to force the function to treat ``vertices`` as already sorted in counterclockwise direction, defaults to False
+	:param bool force_cw: whether to force the function to treat ``vertices`` as already sorted in clockwise direction, defaults to False
+	:return np.ndarray: an (N,) boolean array of whether each point is in the polygon
+	"""
+
+	points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+	if len(vertices) < 3:
+		return np.zeros(len(points), dtype=bool)
+
+	direction = 0
+	if force_ccw:
+		direction = -1
+	elif force_cw:
+		direction = 1
+	else:
+		direction = get_polygon_direction(vertices)
+
+	if direction == 0:
+		return points[:, 1] == ((vertices[1][0] - vertices[0][0])/(vertices[1][1] - vertices[0][1])) * (points[:, 0] - vertices[0][0]) + vertices[0][1]
+
+	# rows are points and columns are edges
+	a = np.asarray(vertices, dtype=np.float64)
+	b = np.roll(a, -1, axis=0)
+	px = points[:, 0, np.newaxis]
+	py = points[:, 1, np.newaxis]
+	cross = (b[:, 0] - a[:, 0]) * (py - a[:, 1]) - (px - a[:, 0]) * (b[:, 1] - a[:, 1])
+
+	# written as the negation of the scalar loop's early exit so that both treat nan the same way
+	return ~np.any(cross * direction >= 0, axis=1)
+
+
+def get_bounding_box(vertices: list[tuple[np.float64, np.float64]]) -> tuple[np.float64, np.float64, np.float64, np.float64]:
+	r"""Gets the axis-aligned bounding box of ``vertices``
+
+	:param list[tuple[np.float64, np.float64]] vertices: a list of 2D coordinate points
+	:return tuple[np.float64, np.float64, np.float64, np.float64]: the bounding box in the form ``(min_x, min_y, max_x, max_y)``
+	"""
+
+	v = np.asarray(vertices, dtype=np.float64)
+	min_x, min_y = v.min(axis=0)
+	max_x, max_y = v.max(axis=0)
+
+	return (min_x, min_y, max_x, max_y)
+
+
+def is_in_bounding_box(point: tuple[np.float64, np.float64], bbox: tuple[np.float64, np.float64, np.float64, np.float64]) -> bool:
+	r"""Checks if ``point`` is inside or on the boundary of ``bbox``
+
+	:param tuple[np.float64, np.float64] point: a 2D coordinate point
+	:param tuple[np.float64, np.float64, np.float64, np.float64] bbox: a bounding box as returned by ``get_bounding_box``
+	:return bool: whether ``point`` is inside or on the boundary of ``bbox``
+	"""
+
+	return bbox[0] <= point[0] <= bbox[2] and bbox[1] <= point[1] <= bbox[3]
+
+
 def is_in_circle(point: tuple[np.float64, np.float64], c: tuple[np.float64, np.float64], r: np.float64) -> bool:
 	r"""Checks if ``point`` is inside or on the boundary of the circle centered at ``c`` with radius ``r``
 
@@ -571,17 +656,17 @@ def distance_to_line(point: tuple[np.float64, np.float64], a: tuple[np.float64,
 	dy = np.float64(b[1] - a[1])
 
 	if dx == 0:
-		return np.abs(point[0] - a[0])
+		return abs(point[0] - a[0])
 	
 	if dy == 0:
-		return np.abs(point[1] - a[1])
+		return abs(point[1] - a[1])
 	
 	m = dx / dy
 	i = -1
 	j = 1 / m
 	k = -(a[1] / m + a[0])
 
-	return np.abs(i * point[0] + j * point[1] + k) / (np.sqrt(i**2 + j**2))
+	return abs(i * point[0] + j * point[1] + k) / math.sqrt(i**2 + j**2)
 
 
 def cross(v1: tuple[np.float64, np.float64, np.float64], v2: tuple[np.float64, np.float64, np.float64]) -> tuple:
@@ -592,7 +677,8 @@ def cross(v1: tuple[np.float64, np.float64, np.float64], v2: tuple[np.float64, n
 	:return tuple: a 3D vector that is perpendicular to ``v1`` and ``v2``
 	"""
 
-	return (np.linalg.det([[v1[1], v1[2]], [v2[1], v2[2]]]), np.linalg.det([[v1[0], v1[2]], [v2[0], v2[2]]]), np.linalg.det([[v1[0], v1[1]], [v2[0], v2[1]]]))
+	# each component is the determinant of a 2x2 minor, written out instead of going through LAPACK
+	return (v1[1] * v2[2] - v1[2] * v2[1], v1[0] * v2[2] - v1[2] * v2[0], v1[0] * v2[1] - v1[1] * v2[0])
 
 
 def get_plane(a: tuple[np.float64, np.float64, np.float64], b: tuple[np.float64, np.float64, np.float64], c: tuple[np.float64, np.float64, np.float64]) -> Callable[[np.float64, np.float64], np.float64]:
@@ -604,8 +690,28 @@ def get_plane(a: tuple[np.float64, np.float64, np.float64], b: tuple[np.float64,
 	:return tuple[np.float64, np.float64, np.float64]: the 3D equation of the plane containing ``a``, ``b``, and ``c``
 	"""
 
+	p, q, r = get_plane_coefficients(a, b, c)
+	return lambda x, y: p * x + q * y + r
+
+
+def get_plane_coefficients(a: tuple[np.float64, np.float64, np.float64], b: tuple[np.float64, np.float64, np.float64], c: tuple[np.float64, np.float64, np.float64]) -> tuple[np.float64, np.float64, np.float64]:
+	r"""Gets the coefficients of the plane containing ``a``, ``b``, and ``c``
+
+	The plane is given in the form ``z = p * x + q * y + r``, so evaluating it doesn't need any division.
+	It also works on arrays of x and y values.
+
+	:param tuple[np.float64, np.float64, np.float64] a: a 3D coordinate point
+	:param tuple[np.float64, np.float64, np.float64] b: a 3D coordinate point
+	:param tuple[np.float64, np.float64, np.float64] c: a 3D coordinate point
+	:return tuple[np.float64, np.float64, np.float64]: the coefficients ``p``, ``q``, and ``r`` of the plane
+	"""
+
 	v = cross((b[0] - a[0], b[1] - a[1], b[2] - a[2]), (c[0] - a[0], c[1] - a[1], c[2] - a[2]))
-	return lambda x, y: a[2] - ((v[0] * (x - a[0]) + v[1] * (y - a[1])) / v[2])
+
+	# $$ v_{x}(x - a_{x}) + v_{y}(y - a_{y}) + v_{z}(z - a_{z}) = 0 $$ solved for z
+	p = -v[0] / v[2]
+	q = -v[1] / v[2]
+	return p, q, a[2] - p * a[0] - q * a[1]
 
 
 def t3d(p: tuple[np.float64, np.float64], z: np.float64) -> tuple[np.float64, np.float64, np.float64]:
@@ -645,10 +751,17 @@ def is_within_segment(p: tuple[np.float64, np.float64], a: tuple[np.float64, np.
 	:return bool: whether ``p`` is contained by the endpoints of ``segment``
 	"""
 
-	t1 = np.subtract(b, a)
-	t2 = np.subtract(p, a)
+	t1x = b[0] - a[0]
+	t1y = b[1] - a[1]
+	t2x = p[0] - a[0]
+	t2y = p[1] - a[1]
+
+	# ``p`` on top of ``a`` (or a segment with no length) has no angle to compare
+	norms = math.hypot(t1x, t1y) * math.hypot(t2x, t2y)
+	if norms == 0:
+		return False
 
-	c = np.dot(t1, t2) / (np.linalg.norm(t1) * np.linalg.norm(t2))
+	c = (t1x * t2x + t1y * t2y) / norms
 
 	return 0 <= c and c <= 1
 
@@ -661,7 +774,8 @@ def proj(a: tuple[np.float64, np.float64], b: tuple[np.float64, np.float64]) ->
 	:return tuple[np.float64, np.float64]: the projection of ``a`` onto ``b``
 	"""
 
-	return (np.dot(a, b) / np.linalg.norm(b)**2) * b
+	scale = (a[0] * b[0] + a[1] * b[1]) / (b[0]**2 + b[1]**2)
+	return (scale * b[0], scale * b[1])
 
 
 def degrees_to_feet(coord1: tuple[np.float64, np.float64], ref_coord: tuple[np.float64, np.float64]) -> tuple[np.float64, np.float64]:
@@ -678,14 +792,33 @@ def degrees_to_feet(coord1: tuple[np.float64, np.float64], ref_coord: tuple[np.f
 
 	# Use average latitude as reference for longitude scaling
 	avg_lat = (coord1[0] + ref_coord[0]) / 2.0
-	avg_lat_rad = np.radians(avg_lat)
+	avg_lat_rad = math.radians(avg_lat)
 
 	# Approximate conversion factors
-	FEET_PER_DEG_LAT = 364000  # approx. feet per degree latitude
-	FEET_PER_DEG_LON = 364000 * np.cos(avg_lat_rad)
+	FEET_PER_DEG_LON = FEET_PER_DEG_LAT * math.cos(avg_lat_rad)
 
 	# Convert degree differences to feet
 	delta_lat_feet = delta_lat * FEET_PER_DEG_LAT
 	delta_lon_feet = delta_lon * FEET_PER_DEG_LON
 
-	return delta_lat_feet, delta_lon_feet
\ No newline at end of file
+	return delta_lat_feet, delta_lon_feet
+
+
+def degrees_to_feet_batch(coords: np.ndarray, ref_coord: tuple[np.float64, np.float64]) -> np.ndarray:
+	r"""Converts every coordinate in ``coords`` to feet
+
+	This is the same conversion as ``degrees_to_feet``, but it is done on every row of ``coords`` at once.
+
+	:param np.ndarray coords: an (N, 2) array of coordinates in degrees
+	:param tuple[np.float64, np.float64] ref_coord: a coordinate in degrees that the converted coordinates are relative to
+	:return np.ndarray: an (N, 2) array of ``coords`` converted to feet
+	"""
+
+	coords = np.asarray(coords, dtype=np.float64)
+
+	delta_lat = ref_coord[0] - coords[:, 0]
+	delta_lon = ref_coord[1] - coords[:, 1]
+
+	avg_lat_rad = np.radians((coords[:, 0] + ref_coord[0]) / 2.0)
+
+	return np.column_stack((delta_lat * FEET_PER_DEG_LAT, delta_lon * FEET_PER_DEG_LAT * np.cos(avg_lat_rad)))
\ No newline at end of file
@@ -0,0 +1,29 @@
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from runway_surfaces.cli import cli
+
+EXAMPLES = Path(__file__).resolve().parent.parent / "examples"
+
+
+def test_example_airport():
+	result = CliRunner().invoke(cli, [str(EXAMPLES / "RIC.csv"), "37.51", "77.32", "1000", "1000"])
+
+	assert result.exit_code == 0
+	assert "imaginary zone" in result.output
+
+
+def test_malformed_coords(tmp_path):
+	# a row with too few values followed by one with too many used to shift into a pair of valid looking runways
+	csvfile = tmp_path / "runways.csv"
+	csvfile.write_text(
+		"name,type,approaches,coords,end_names,special_surface\n"
+		"2-20,utility,visual-visual,37.52_77.33_37.51,2-20,false\n"
+		"16-34,utility,visual-visual,37.51_77.32_37.50_77.31_37.49,16-34,false\n"
+	)
+
+	result = CliRunner().invoke(cli, [str(csvfile), "37.51", "77.32", "1000", "1000"])
+
+	assert result.exit_code == 2
+	assert "runway 2-20 has 3 coordinate values instead of 4" in result.output
@@ -0,0 +1,33 @@
+import pytest
+
+from runway_surfaces.runway import *
+
+
+def make_runway(runway_type: RunwayTypes = RunwayTypes.UTILITY, approach1: ApproachTypes = ApproachTypes.VISUAL, approach2: ApproachTypes = ApproachTypes.VISUAL) -> Runway:
+	return Runway("1-19", runway_type, RunwayEnd("1", (0.0, 0.0), approach1), RunwayEnd("19", (0.0, 5000.0), approach2))
+
+
+@pytest.mark.parametrize("name", ["runway_type", "end1", "end2", "visiblity_minimums"])
+def test_cached_inputs_are_read_only(name):
+	runway = make_runway()
+
+	with pytest.raises(AttributeError):
+		setattr(runway, name, getattr(runway, name))
+
+
+def test_end_approach_type_is_read_only():
+	runway = make_runway()
+
+	with pytest.raises(AttributeError):
+		runway.end1.approach_type = ApproachTypes.PRECISION_INSTRUMENT
+	assert runway.calc_approach_dimensions()[runway.end1].type == ApproachTypes.VISUAL
+
+
+def test_approach_dimensions_are_frozen():
+	runway = make_runway(RunwayTypes.PRECISION_INSTRUMENT, ApproachTypes.PRECISION_INSTRUMENT, ApproachTypes.PRECISION_INSTRUMENT)
+	dimensions = runway.calc_approach_dimensions()[runway.end1]
+
+	with pytest.raises(AttributeError):
+		dimensions.width = 0
+	assert dimensions == ApproachDimensions(ApproachTypes.PRECISION_INSTRUMENT, width=16000, primary_length=10000, secondary_length=40000, primary_slope=0.02, secondary_slope=0.025)
+	assert dimensions is runway.calc_approach_dimensions()[runway.end2]
@@ -0,0 +1,244 @@
+import csv
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from runway_surfaces.runway import *
+from runway_surfaces.surfaces import *
+from runway_surfaces.util import *
+
+EXAMPLES = Path(__file__).resolve().parent.parent / "examples"
+
+
+def load_runways(name: str, position: tuple[float, float]) -> list[Runway]:
+	"""Loads one of the example airports the same way ``cli`` does"""
+
+	with open(EXAMPLES / name, newline="") as f:
+		rows = list(csv.DictReader(f))
+
+	coords = np.array([[float(value) for value in row["coords"].split("_")] for row in rows]).reshape(-1, 2)
+	coords = degrees_to_feet_batch(coords, position)
+
+	runways = []
+	for i, row in enumerate(rows):
+		approaches = row["approaches"].upper().split("-")
+		end_names = row["end_names"].split("-")
+		end1 = RunwayEnd(end_names[0], tuple(coords[2 * i]), ApproachTypes[approaches[0]])
+		end2 = RunwayEnd(end_names[1], tuple(coords[2 * i + 1]), ApproachTypes[approaches[1]])
+		runways.append(Runway(row["name"], RunwayTypes[row["type"].upper()], end1, end2, special_surface=row["special_surface"].lower() == "true"))
+
+	return runways
+
+
+def build_runways(layout: list[tuple[str, tuple[float, float], tuple[float, float], bool]]) -> list[Runway]:
+	"""Builds runways with visual approaches from ``(type, end1, end2, special_surface)`` tuples"""
+
+	return [
+		Runway(str(i), RunwayTypes[runway_type], RunwayEnd("a", tuple(map(np.float64, a)), ApproachTypes.VISUAL), RunwayEnd("b", tuple(map(np.float64, b)), ApproachTypes.VISUAL), special_surface=special_surface)
+		for i, (runway_type, a, b, special_surface) in enumerate(layout)
+	]
+
+
+def assert_outline(edges: list[Edge], expected: list[tuple]) -> None:
+	"""Compares a horizontal surface outline against ``("Edge", p1, p2, center)`` and ``("Arc", center, radius)`` tuples"""
+
+	assert len(edges) == len(expected)
+	for edge, want in zip(edges, expected):
+		assert type(edge).__name__ == want[0]
+		if want[0] == "Arc":
+			assert edge.center == pytest.approx(want[1], abs=1e-5)
+			assert edge.radius == want[2]
+		else:
+			assert edge.p1 == pytest.approx(want[1], abs=1e-5)
+			assert edge.p2 == pytest.approx(want[2], abs=1e-5)
+			if want[3] is None:
+				assert len(edge.center) == 0
+			else:
+				assert edge.center == pytest.approx(want[3], abs=1e-5)
+
+
+RIC_OUTLINE = [
+	("Edge", (-4689.765513, -10996.668188), (1716.634487, -12527.264011), None),
+	("Arc", (4040.400000, -2801.005027), 10000.0),
+	("Edge", (12108.226233, 3107.478694), (9371.635198, 6844.197282), None),
+	("Arc", (5337.722081, 3889.955422), 5000.0),
+	("Edge", (5234.355314, 8888.886839), (-2572.733534, 8727.453631), None),
+	("Edge", (-2572.733534, 8727.453631), (-4689.765513, -10996.668188), (-2607.722081, -1146.500602)),
+]
+
+ATL_OUTLINE = [
+	("Edge", (-10243.011812, 13921.957158), (-11225.811812, 12709.737095), None),
+	("Arc", (-3458.000000, 6412.031191), 10000.0),
+	("Edge", (-13458.000000, 6412.031191), (-13458.000000, -2927.233206), None),
+	("Arc", (-3458.000000, -2927.233206), 10000.0),
+	("Edge", (-7975.259078, -11848.800917), (-2588.059078, -14576.502919), None),
+	("Arc", (1929.200000, -5654.935208), 10000.0),
+	("Edge", (1928.329898, -15654.935170), (2983.929898, -15655.027018), None),
+	("Arc", (2984.800000, -5655.027055), 10000.0),
+	("Edge", (3128.720277, -15653.991350), (7314.720277, -15593.740081), None),
+	("Arc", (7170.800000, -5594.775787), 10000.0),
+	("Edge", (17170.800000, -5594.775787), (17170.800000, 3746.004310), None),
+	("Arc", (7170.800000, 3746.004310), 10000.0),
+	("Edge", (12536.932340, 12184.287530), (7295.332340, 15517.562621), None),
+	("Arc", (1929.200000, 7079.279401), 10000.0),
+	("Edge", (3157.170663, 17003.597415), (-1247.229337, 17548.569269), None),
+	("Edge", (-1247.229337, 17548.569269), (-10243.011812, 13921.957158), (-2475.200000, 7624.251255)),
+]
+
+# random layouts whose outlines changed when candidate tangents started being validated with one signed-distance test.
+# both used to be missing two of their edges
+CHANGED_LAYOUTS = [
+	(
+		[
+			("UTILITY", (2710.1078699716018, -10426.912556069437), (-998.3224237464817, -4789.147630798223), False),
+			("UTILITY", (2710.1078699716018, -10426.912556069437), (7372.349574807308, 19677.097932471468), True),
+		],
+		[
+			("Edge", (-5228.285154, -7455.121243), (-1550.464175, -13290.529964), None),
+			("Arc", (2679.498555, -10624.556351), 5000.0),
+			("Edge", (7620.593438, -11389.789231), (7651.202753, -11192.145436), None),
+			("Arc", (2710.107870, -10426.912556), 5000.0),
+			("Edge", (7651.202753, -11192.145436), (12344.053773, 19109.508848), None),
+			("Arc", (7402.958890, 19874.741728), 5000.0),
+			("Edge", (2670.005879, 21486.931481), (-5731.275434, -3176.957878), None),
+			("Edge", (-5731.275434, -3176.957878), (-5228.285154, -7455.121243), (-998.322424, -4789.147631)),
+		],
+	),
+	(
+		[
+			("NON_PRECISION_INSTRUMENT", (1376.541982446853, 13366.521434102027), (-796.00512341326, 19279.873928411358), False),
+			("PRECISION_INSTRUMENT", (1376.541982446853, 13366.521434102027), (-17200.603845362064, 6566.429369456309), True),
+		],
+		[
+			("Edge", (-13951.007541, -2892.964050), (4813.951191, 3975.876199), None),
+			("Arc", (1376.541982, 13366.521434), 10000.0),
+			("Edge", (4813.951191, 3975.876199), (5001.764096, 4044.624383), None),
+			("Arc", (1564.354887, 13435.269618), 10000.0),
+			("Edge", (10836.751753, 17179.953365), (8476.391743, 23024.557675), None),
+			("Arc", (-796.005123, 19279.873928), 10000.0),
+			("Edge", (-6898.750075, 27201.774209), (-23491.161701, 14419.581466), None),
+			("Edge", (-23491.161701, 14419.581466), (-13951.007541, -2892.964050), (-17388.416750, 6497.681185)),
+		],
+	),
+]
+
+
+def test_example_outlines():
+	assert_outline(get_horizontal_surface_edges(load_runways("RIC.csv", (37.51, 77.32))), RIC_OUTLINE)
+	assert_outline(get_horizontal_surface_edges(load_runways("ATL.csv", (33.64, 84.43))), ATL_OUTLINE)
+
+
+@pytest.mark.parametrize("layout, expected", CHANGED_LAYOUTS)
+def test_changed_layout_outlines(layout, expected):
+	runways = build_runways(layout)
+	edges = get_horizontal_surface_edges(runways)
+	assert_outline(edges, expected)
+
+	# every endpoint circle has to be on or to the left of every straight tangent line of the outline
+	points = []
+	radii = []
+	for runway in runways:
+		ends = [runway.end1.point, runway.end2.point]
+		if runway.special_surface:
+			ends = extend_points_in_both_directions(*ends, np.float64(200))
+		points.extend(ends)
+		radii.extend([runway.calc_hsurface_radius()] * 2)
+
+	for edge in edges:
+		if type(edge) is Edge and len(edge.center) == 0:
+			assert np.all(get_signed_distances(edge.p1, edge.p2, np.array(points)) >= np.array(radii) - 1e-6)
+
+
+@pytest.mark.parametrize("name, position", [("RIC.csv", (37.51, 77.32)), ("ATL.csv", (33.64, 84.43))])
+def test_is_in_horizontal_surface_batch(name, position):
+	hsurface = get_horizontal_surface_edges(load_runways(name, position))
+	positions = np.random.default_rng(0).uniform(-25000, 25000, (2000, 2))
+
+	inside = is_in_horizontal_surface_batch(positions, hsurface)
+
+	assert np.any(inside) and not np.all(inside)
+	for point, hit in zip(positions, inside):
+		assert hit == is_in_horizontal_surface(tuple(point), hsurface)
+
+
+@pytest.mark.parametrize("name, position", [("RIC.csv", (37.51, 77.32)), ("ATL.csv", (33.64, 84.43))])
+def test_get_zone_information_batch(name, position):
+	runways = load_runways(name, position)
+	rng = np.random.default_rng(1)
+	# heights just above the airport elevation so that every kind of zone shows up
+	positions = np.column_stack((rng.uniform(-12000, 12000, (2000, 2)), rng.uniform(1000, 1040, 2000)))
+
+	infos = get_zone_information_batch(positions, runways, 1000.0)
+
+	surfaces = precompute_surfaces(runways)
+	assert infos == [get_zone_information(tuple(point), runways, 1000.0, surfaces=surfaces) for point in positions]
+
+
+def test_mixed_approach_surfaces():
+	# each end's approach surface has to use that end's own dimensions
+	runway = Runway("1-19", RunwayTypes.PRECISION_INSTRUMENT, RunwayEnd("1", (0.0, 0.0), ApproachTypes.VISUAL), RunwayEnd("19", (3000.0, 4000.0), ApproachTypes.PRECISION_INSTRUMENT))
+	_, _, asurfaces, _ = get_runway_surfaces(runway)
+
+	for end, length, width in ((runway.end1, 5000, 1500), (runway.end2, 50000, 16000)):
+		near1, near2, far1, far2 = asurfaces[end]
+		near = ((near1[0] + near2[0]) / 2, (near1[1] + near2[1]) / 2)
+		far = ((far1[0] + far2[0]) / 2, (far1[1] + far2[1]) / 2)
+		assert calc_distance(near, far) == pytest.approx(length)
+		assert calc_distance(far1, far2) == pytest.approx(width)
+
+
+@pytest.mark.parametrize("offset", [0.0, 1e-5])
+def test_shared_endpoint_keeps_larger_radius(offset):
+	# the utility runway comes last, so its smaller radius used to replace the precision runway's at their shared end
+	runways = build_runways([
+		("PRECISION_INSTRUMENT", (0.0, 0.0), (8000.0, 0.0), False),
+		("UTILITY", (offset, 0.0), (0.0, 5000.0), False),
+	])
+
+	edges = get_horizontal_surface_edges(runways)
+
+	assert [edge.radius for edge in edges if type(edge) is Arc] == [10000.0]
+	for edge in edges:
+		if type(edge) is Edge and len(edge.center) == 0:
+			assert get_signed_distances(edge.p1, edge.p2, np.array([(0.0, 0.0)]))[0] == pytest.approx(10000.0)
+
+
+def test_get_zone_information_checks_surfaces():
+	ric = load_runways("RIC.csv", (37.51, 77.32))
+	surfaces = precompute_surfaces(ric)
+
+	# any list of the same runways can be used with the cache
+	assert get_zone_information((0.0, 0.0, 1000.0), list(ric), 1000.0, surfaces=surfaces) == get_zone_information((0.0, 0.0, 1000.0), ric, 1000.0)
+	with pytest.raises(ValueError):
+		get_zone_information((0.0, 0.0, 1000.0), load_runways("ATL.csv", (33.64, 84.43)), 1000.0, surfaces=surfaces)
+
+
+def test_zero_width_primary_surface():
+	# a non-precision instrument runway without a non-precision approach and with low visibility minimums has no primary surface width
+	runway = Runway("1-19", RunwayTypes.NON_PRECISION_INSTRUMENT, RunwayEnd("1", (0.0, 0.0), ApproachTypes.VISUAL), RunwayEnd("19", (0.0, 5000.0), ApproachTypes.VISUAL))
+	assert runway.calc_psurface_width() == 0
+
+	_, _, _, tsurfaces = get_runway_surfaces(runway)
+
+	# its transitional surfaces can't be built, so they're nan polygons that contain no point
+	assert len(tsurfaces) == 2
+	for tsurface in tsurfaces:
+		assert np.isnan(tsurface).any()
+		for position in ((100.0, 2500.0, 1000.0), (-300.0, 1000.0, 1010.0), (500.0, 4000.0, 1001.0)):
+			assert is_in_transitional_surface(position, tsurface, 1000.0) is None
+	assert get_zone_information((100.0, 2500.0, 1000.0), [runway], 1000.0)["zone"] == "Horizontal"
+
+
+def test_precision_approach_surface():
+	runway = Runway("1-19", RunwayTypes.PRECISION_INSTRUMENT, RunwayEnd("1", (0.0, 0.0), ApproachTypes.PRECISION_INSTRUMENT), RunwayEnd("19", (0.0, 5000.0), ApproachTypes.PRECISION_INSTRUMENT))
+	approach_dimensions, _, asurfaces, _ = get_runway_surfaces(runway)
+	asurface = asurfaces[runway.end2]
+	dimensions = approach_dimensions[runway.end2]
+
+	# positions under the first and second sections of the approach surface at end 19 are bounded by it
+	for position in ((0.0, 8000.0, 0.0), (0.0, 25000.0, 0.0)):
+		assert callable(is_in_approach_surface(position, asurface, dimensions, 1000.0))
+	assert is_in_approach_surface((0.0, 8000.0, 5000.0), asurface, dimensions, 1000.0) is None
+
+	assert get_zone_information((0.0, 8000.0, 1010.0), [runway], 1000.0)["zone"] == "Horizontal"
@@ -0,0 +1,152 @@
+import math
+
+import numpy as np
+import pytest
+
+from runway_surfaces.util import *
+
+
+def random_circles(rng: np.random.Generator, n: int) -> tuple[np.ndarray, np.ndarray]:
+	"""Gets random circles, some of which share a center or are inside of another circle"""
+
+	centers = rng.uniform(-20000, 20000, (n, 2))
+	radii = rng.choice([5000.0, 10000.0], n)
+	centers[1] = centers[0]
+	centers[3] = centers[2] + 1000
+	radii[3] = 2000.0
+
+	return centers, radii
+
+
+def test_cet2cr_batch():
+	rng = np.random.default_rng(0)
+	centers, radii = random_circles(rng, 40)
+	first = np.repeat(np.arange(len(centers)), len(centers))
+	second = np.tile(np.arange(len(centers)), len(centers))
+
+	tangents = cet2cr_batch(centers[first], radii[first], centers[second], radii[second])
+
+	for i, j, tangent in zip(first, second, tangents):
+		expected = cet2cr(tuple(centers[i]), radii[i], tuple(centers[j]), radii[j])
+		if expected:
+			assert tangent == pytest.approx(np.array(expected), abs=1e-6)
+		else:
+			assert np.all(np.isnan(tangent))
+
+
+@pytest.mark.parametrize("c2, r1, r2", [
+	((0.2739233746429086, -0.4604265724722594), 0.5614602859042921, 1.0972089618842817),
+	((0.6265404784005448, 0.8255111545554434), 1.4099536636507697, 2.446303815563647),
+	((0.4589931219679968, 0.08724998293084574), 1.9026086356816523, 2.369820841788643),
+])
+def test_cet2cr_batch_nearly_tangent(c2, r1, r2):
+	# circles that are within rounding error of being internally tangent
+	expected = cet2cr((0.0, 0.0), r1, c2, r2)
+	tangent = cet2cr_batch([(0.0, 0.0)], [r1], [c2], [r2])[0]
+
+	assert expected
+	assert tangent == pytest.approx(np.array(expected), abs=1e-9)
+
+
+def test_circle_in_circle_batch():
+	rng = np.random.default_rng(1)
+	centers, radii = random_circles(rng, 40)
+
+	contained = circle_in_circle_batch(centers, radii)
+
+	for i in range(len(centers)):
+		for j in range(len(centers)):
+			assert contained[i, j] == circle_in_circle(tuple(centers[i]), radii[i], tuple(centers[j]), radii[j])
+
+
+def test_extend_points_in_both_directions_batch():
+	rng = np.random.default_rng(2)
+	p1 = rng.uniform(-10000, 10000, (50, 2))
+	p2 = rng.uniform(-10000, 10000, (50, 2))
+
+	e1, e2 = extend_points_in_both_directions_batch(p1, p2, np.float64(200))
+
+	for a, b, x, y in zip(p1, p2, e1, e2):
+		expected = extend_points_in_both_directions(tuple(a), tuple(b), np.float64(200))
+		assert x == pytest.approx(expected[0], abs=1e-6)
+		assert y == pytest.approx(expected[1], abs=1e-6)
+
+	# a segment with no length can't be extended
+	e1, e2 = extend_points_in_both_directions_batch(p1[:1], p1[:1], np.float64(200))
+	assert np.all(np.isnan(e1)) and np.all(np.isnan(e2))
+
+
+def test_degrees_to_feet_batch():
+	rng = np.random.default_rng(3)
+	ref = (33.64, 84.43)
+	coords = np.column_stack((rng.uniform(33.5, 33.8, 50), rng.uniform(84.3, 84.6, 50)))
+
+	feet = degrees_to_feet_batch(coords, ref)
+
+	for coord, converted in zip(coords, feet):
+		assert converted == pytest.approx(degrees_to_feet(tuple(coord), ref), rel=1e-12, abs=1e-6)
+
+
+def test_argsort_directional():
+	# the points of a square, starting at 12 o'clock and going clockwise
+	square = [(0.0, 1.0), (1.0, 0.0), (0.0, -1.0), (-1.0, 0.0)]
+	assert list(argsort_directional(square[::-1], ccw=False)) == [3, 2, 1, 0]
+	assert list(argsort_directional(square, ccw=True)) == [3, 2, 1, 0]
+
+	rng = np.random.default_rng(4)
+	points = rng.uniform(-10000, 10000, (50, 2))
+	center = points.mean(axis=0)
+	order = argsort_directional(points, ccw=False)
+
+	assert sorted(order) == list(range(len(points)))
+	angles = [math.atan2(x - center[0], y - center[1]) % (2 * math.pi) for x, y in points[order]]
+	assert angles == sorted(angles)
+	assert list(argsort_directional(points, ccw=True)) == list(order[::-1])
+
+	# of two points at the same angle, the farther one comes first clockwise
+	assert list(argsort_directional([(0.0, 3.0), (0.0, 6.0), (3.0, -3.0), (-3.0, -3.0)], ccw=False)) == [1, 0, 2, 3]
+
+
+@pytest.mark.parametrize("ccw", [True, False])
+def test_is_in_polygon_batch(ccw):
+	rng = np.random.default_rng(5)
+	angles = np.sort(rng.uniform(0, 2 * np.pi, 8))
+	if not ccw:
+		angles = angles[::-1]
+	vertices = [(5000 * math.cos(angle), 5000 * math.sin(angle)) for angle in angles]
+	points = rng.uniform(-6000, 6000, (500, 2))
+
+	inside = is_in_polygon_batch(points, vertices)
+
+	assert np.any(inside) and not np.all(inside)
+	for point, hit in zip(points, inside):
+		assert hit == is_in_polygon(tuple(point), vertices)
+
+
+def test_calc_distance_batch():
+	rng = np.random.default_rng(6)
+	p1 = rng.uniform(-10000, 10000, (20, 2))
+	p2 = rng.uniform(-10000, 10000, (30, 2))
+
+	distances = calc_distance_batch(p1[:, np.newaxis], p2)
+
+	assert distances.shape == (20, 30)
+	for i in range(len(p1)):
+		for j in range(len(p2)):
+			assert distances[i, j] == pytest.approx(calc_distance(tuple(p1[i]), tuple(p2[j])))
+
+
+def test_get_signed_distances():
+	rng = np.random.default_rng(7)
+	a = rng.uniform(-10000, 10000, (3, 4, 2))
+	b = rng.uniform(-10000, 10000, (3, 4, 2))
+	p = rng.uniform(-10000, 10000, (10, 2))
+
+	distances = get_signed_distances(a, b, p)
+
+	assert distances.shape == (3, 4, 10)
+	for i in range(3):
+		for j in range(4):
+			assert distances[i, j] == pytest.approx(get_signed_distances(tuple(a[i, j]), tuple(b[i, j]), p))
+			# points to the left of the line are positive
+			assert np.sign(distances[i, j]) == pytest.approx(np.sign([get_side_of_line(tuple(a[i, j]), tuple(b[i, j]), tuple(point)) for point in p]))